@@ -0,0 +1,116 @@
+# python benchmarks/bench_campaign.py (campaña completa en modo pipeline sin Reddit ni OpenAI)
+# python benchmarks/bench_campaign.py --reddit-latency 0.3 --llm-latency 2.0 --json bench.json
+# python benchmarks/bench_campaign.py --record benchmarks/fixtures/recorded.json (graba publicaciones reales con las credenciales del .env)
+
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+PROJECT_DIR = os.path.dirname(BENCH_DIR)
+sys.path.insert(0, PROJECT_DIR)
+
+DEFAULT_SUBMISSIONS = os.path.join(BENCH_DIR, "fixtures", "submissions.json")
+
+
+class _Draft:
+    def __init__(self, content):
+        self.content = content
+
+
+class FakeChatModel:
+    """Stands in for ChatOpenAI in run_pipeline: fixed latency per draft, honours max_concurrency."""
+
+    def __init__(self, latency):
+        self.latency = latency
+        self.calls = 0
+
+    def _invoke(self, messages):
+        self.calls += 1
+        time.sleep(self.latency)
+        return _Draft(f"Benchmark comment for: {messages[-1][1].splitlines()[0]}")
+
+    def batch(self, inputs, config=None, return_exceptions=False):
+        max_workers = (config or {}).get("max_concurrency") or len(inputs) or 1
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(self._invoke, inputs))
+
+
+def run(args):
+    started = time.perf_counter()
+    from tools import instrumentation
+    from tools.fake_reddit import FakeReddit
+    from tools.job_queue import JobQueue
+    from tools.rate_limiter import RateLimiter
+    from tools.reddit_api import set_reddit_client, set_state
+    from tools.seen_index import SeenIndex
+
+    import reddit as campaign
+    from pipeline import run_pipeline
+    import_time = time.perf_counter() - started
+
+    # Fresh queue, seen index and metrics file for every run
+    work_dir = tempfile.mkdtemp(prefix="reddit-bench-")
+    instrumentation.METRICS_PATH = os.path.join(work_dir, "metrics.jsonl")
+    set_state(
+        job_queue=JobQueue(os.path.join(work_dir, "jobs.db")),
+        rate_limiter=RateLimiter(1_000_000, 1_000_000) if args.no_rate_limit else None,
+        seen_index=SeenIndex(os.path.join(work_dir, "seen.db")),
+    )
+
+    campaign.use_campaign_reference()
+    fake = FakeReddit.from_json(args.submissions, latency=args.reddit_latency)
+    set_reddit_client(fake)
+    llm = FakeChatModel(args.llm_latency)
+
+    started = time.perf_counter()
+    results = run_pipeline(campaign.things_to_promote, campaign.search_queries, llm=llm)
+    elapsed = time.perf_counter() - started
+    instrumentation.print_summary()
+
+    return {
+        "submissions": len(fake._submissions),
+        "import_time_s": round(import_time, 3),
+        "wall_time_s": round(elapsed, 3),
+        "reddit_requests": fake.requests,
+        "llm_calls": llm.calls,
+        "scheduled_replies": sum(1 for result in results if result.get("status") == "scheduled"),
+        "errors": sum(1 for result in results if result.get("error")),
+    }
+
+
+def record(path):
+    from reddit import search_queries
+    from tools.fake_reddit import record_submissions
+    from tools.reddit_api import get_reddit
+
+    count = record_submissions(get_reddit(), search_queries, path)
+    print(f"{count} publicaciones grabadas en {path}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Offline benchmark of the Reddit campaign pipeline")
+    parser.add_argument("--submissions", default=DEFAULT_SUBMISSIONS, help="recorded submissions (JSON)")
+    parser.add_argument("--reddit-latency", type=float, default=0.2, help="seconds per fake Reddit request")
+    parser.add_argument("--llm-latency", type=float, default=1.0, help="seconds per fake draft")
+    parser.add_argument("--no-rate-limit", action="store_true", help="don't pace the fake Reddit requests")
+    parser.add_argument("--record", metavar="FILE", help="record real submissions instead of benchmarking")
+    parser.add_argument("--json", metavar="FILE", help="also write the result as JSON")
+    args = parser.parse_args()
+
+    if args.record:
+        record(os.path.abspath(args.record))
+        sys.exit()
+
+    args.submissions = os.path.abspath(args.submissions)
+    json_path = os.path.abspath(args.json) if args.json else None
+    result = run(args)
+    print(json.dumps(result, indent=2))
+    if json_path:
+        with open(json_path, "w") as f:
+            json.dump({"args": vars(args), "result": result}, f, indent=2)
+        print(f"\nResults written to {json_path}")
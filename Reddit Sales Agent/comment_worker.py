@@ -0,0 +1,92 @@
+# python comment_worker.py (para publicar los comentarios programados por el agente)
+# python comment_worker.py --once (para publicar el siguiente comentario si ya toca y salir)
+
+import argparse
+import time
+
+from praw.exceptions import RedditAPIException
+from prawcore.exceptions import RequestException, ServerError, TooManyRequests
+
+from tools.reddit_api import REPLY_JOB, REPLY_SPACING_MINS, get_job_queue, get_seen_index, reply_to_post
+
+MAX_ATTEMPTS = 3
+# Wait before retrying after a 5xx, a connection error or a 429 without Retry-After
+TRANSIENT_RETRY_SECONDS = 60
+# Longest nap between queue checks, so jobs enqueued meanwhile are picked up
+MAX_IDLE_SECONDS = 60
+# A claimed reply still "running" after this long belongs to a worker that died
+CLAIM_TIMEOUT_SECONDS = 300
+
+
+def _retry_delay(error):
+    """Seconds to wait before retrying a transient error, or None when retrying won't help.
+
+    RATELIMIT API errors carry the wait in their message ("... try again in 9 minutes.").
+    """
+    if isinstance(error, TooManyRequests):
+        try:
+            return float(error.retry_after)
+        except (TypeError, ValueError):
+            return TRANSIENT_RETRY_SECONDS
+    if isinstance(error, (ServerError, RequestException)):
+        return TRANSIENT_RETRY_SECONDS
+    if not isinstance(error, RedditAPIException):
+        return None
+    for item in error.items:
+        if item.error_type == "RATELIMIT":
+            words = item.message.split()
+            for i, word in enumerate(words[:-1]):
+                if word.isdigit():
+                    unit = words[i + 1]
+                    return int(word) * (60 if unit.startswith("minut") else 1)
+            return 10 * 60
+    return None
+
+
+def seconds_until_next_reply():
+    """Spacing is enforced again here: after downtime, overdue replies must not go out in a burst."""
+    last = get_job_queue().last_completed_at(REPLY_JOB)
+    return 0 if last is None else last + REPLY_SPACING_MINS * 60 - time.time()
+
+
+def process_due_jobs():
+    queue = get_job_queue()
+    processed = 0
+    for job in queue.claim_due(REPLY_JOB, limit=1):
+        payload = job["payload"]
+        try:
+            result = reply_to_post(payload["submission_id"], payload["message"])
+            queue.complete(job["id"], result)
+            print(f"Comentario publicado: {result['url']}")
+        except Exception as e:
+            delay = _retry_delay(e)
+            if delay is not None and job["attempts"] < MAX_ATTEMPTS:
+                queue.fail(job["id"], str(e), retry_at=time.time() + delay)
+                print(f"Error temporal en {payload['submission_id']}, reintento en {delay:.0f} s: {e}")
+            else:
+                queue.fail(job["id"], str(e))
+                # Nothing was posted: later runs may pick this submission again
+                get_seen_index().forget([payload["submission_id"]])
+                print(f"Error publicando en {payload['submission_id']}: {e}")
+        processed += 1
+    return processed
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Publica los comentarios de Reddit programados en la cola")
+    parser.add_argument("--once", action="store_true", help="publicar el siguiente comentario si ya toca y salir")
+    args = parser.parse_args()
+
+    while True:
+        requeued = get_job_queue().requeue_stale(REPLY_JOB, CLAIM_TIMEOUT_SECONDS)
+        if requeued:
+            print(f"{requeued} comentarios interrumpidos vuelven a la cola")
+        wait = seconds_until_next_reply()
+        if wait <= 0:
+            if process_due_jobs():
+                continue
+            next_due = get_job_queue().next_due_at(REPLY_JOB)
+            wait = MAX_IDLE_SECONDS if next_due is None else next_due - time.time()
+        if args.once:
+            break
+        time.sleep(min(max(wait, 1), MAX_IDLE_SECONDS))
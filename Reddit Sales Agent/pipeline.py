@@ -0,0 +1,84 @@
+import os
+import time
+from typing import Any, Dict, List
+
+from dotenv import load_dotenv
+
+from prompts import COMMENT_WRITER_BACKSTORY
+from tools.instrumentation import record
+from tools.reddit_api import drain_monitored_posts, fetch_posts, schedule_reply, search_posts_multi, select_new_posts
+
+load_dotenv()
+
+DRAFT_MODEL = os.getenv("REDDIT_DRAFT_MODEL", "gpt-4o-mini")
+# Drafts requested from the LLM at the same time
+DRAFT_CONCURRENCY = int(os.getenv("REDDIT_DRAFT_CONCURRENCY", "4"))
+# Replies scheduled per run, like the crew's "2 most relevant posts"
+PIPELINE_MAX_POSTS = int(os.getenv("REDDIT_PIPELINE_MAX_POSTS", "2"))
+
+
+def _stage(name, started, **extra):
+    seconds = time.perf_counter() - started
+    print(f"[pipeline] {name}: {seconds:.2f}s")
+    record("stage", name.split(" (")[0], seconds, **extra)
+    return time.perf_counter()
+
+
+def draft_messages(things_to_promote: str, post: Dict[str, Any]):
+    return [
+        ("system", f"{COMMENT_WRITER_BACKSTORY}\nCOSAS QUE QUEREMOS PROMOVER Y PROMOCIONAR:\n{things_to_promote}\n\n"
+                   "Responde solo con el texto del comentario."),
+        ("human", f"Título: {post['title']}\nURL: {post['url']}\n\n{post['content']}"),
+    ]
+
+
+def run_pipeline(things_to_promote: str, search_queries: List[str], llm=None) -> List[Dict[str, Any]]:
+    """Campaign without the manager LLM: search, rank and fetch are plain Python, one LLM call per draft.
+
+    Replies are enqueued for comment_worker.py exactly like the crew's poster does, at most
+    REDDIT_PIPELINE_MAX_POSTS per run. `llm` is any LangChain chat model (ChatOpenAI by default).
+    """
+    started = time.perf_counter()
+    candidates = drain_monitored_posts()
+    if search_queries:
+        found, errors = search_posts_multi(search_queries)
+        for keywords, error in errors.items():
+            print(f"[pipeline] búsqueda '{keywords}' falló: {error}")
+        candidates += found
+    started = _stage(f"candidates ({len(candidates)})", started)
+
+    # De-duplicate monitor and search hits before ranking. Posts aren't marked here: only
+    # scheduled ones are (as replied), so a failed draft is picked again next run
+    posts = select_new_posts(list({post["submission_id"]: post for post in candidates}.values()),
+                             top_k=PIPELINE_MAX_POSTS, mark=False)
+    started = _stage(f"ranking ({len(posts)} selected)", started)
+    if not posts:
+        print("No hay publicaciones relevantes nuevas")
+        return []
+
+    # Refresh content (the monitor's copy may be stale) in one /api/info request
+    contents = fetch_posts([post["submission_id"] for post in posts])
+    posts = [dict(post, **contents[post["submission_id"]]) for post in posts if post["submission_id"] in contents]
+    started = _stage("fetch", started)
+
+    if llm is None:
+        from langchain_openai import ChatOpenAI
+
+        llm = ChatOpenAI(model=DRAFT_MODEL)
+    drafts = llm.batch([draft_messages(things_to_promote, post) for post in posts],
+                       config={"max_concurrency": DRAFT_CONCURRENCY}, return_exceptions=True)
+    usage = [getattr(draft, "usage_metadata", None) or {} for draft in drafts if not isinstance(draft, Exception)]
+    started = _stage(f"drafting ({len(drafts)} comments)", started,
+                     prompt_tokens=sum(item.get("input_tokens", 0) for item in usage),
+                     completion_tokens=sum(item.get("output_tokens", 0) for item in usage))
+
+    results = []
+    for post, draft in zip(posts, drafts):
+        if isinstance(draft, Exception):
+            results.append({"submission_id": post["submission_id"], "error": str(draft)})
+            continue
+        scheduled = schedule_reply(post["submission_id"], draft.content.strip())
+        results.append(dict(scheduled, submission_id=post["submission_id"], title=post["title"],
+                            url=post["url"], comment=draft.content.strip()))
+    _stage("scheduling", started)
+    return results
@@ -1,24 +1,23 @@
 # python3 -m venv venv (para crear un entorno virtual)
 # source venv/bin/activate (para activar el entorno virtual)
 # pip install crewai tools (para instalar las dependencias)
-# python reddit.py (para ejecutar el script)
+# python reddit.py (para ejecutar el script: pipeline sin LLM gestor, solo redacta con LLM)
+# python reddit.py --mode crew (para usar el crew jerárquico con manager_llm)
+# python comment_worker.py (en otra terminal, para publicar los comentarios programados)
+# python subreddit_monitor.py (en otra terminal, para detectar publicaciones nuevas al momento)
 
-from crewai import Crew, Process
+import argparse
+import time
 
-from agents import RedditAgents
-from tasks import RedditTasks
-from langchain_openai import OpenAI
+from pipeline import run_pipeline
+from subreddit_monitor import DEFAULT_KEYWORDS_FILE, load_keywords
+from tools.instrumentation import CrewTimer, print_summary, record_usage
+from tools.relevance import set_reference
 from dotenv import load_dotenv
 import os
 
 load_dotenv()
 
-OpenAIGPT4 = OpenAI(model="gpt-4o-mini") #api_key=os.getenv("OPENAI_API_KEY")
-
-agents = RedditAgents()
-tasks = RedditTasks()
-
-
 
 things_to_promote = """
 Canal de YouTube sobre IA (https://www.youtube.com/channel/UCrXSVX9a1mj810CMLwkGvMw), a continuación los 3 videos más recientes:
@@ -27,32 +26,81 @@ Canal de YouTube sobre IA (https://www.youtube.com/channel/UCrXSVX9a1mj810CMLwkG
 3. Cómo construir un web scraper universal para extraer datos de sitios web con Agentes de IA.
 """
 
-# Configuración de agentes
-reddit_post_finder = agents.reddit_post_finder()
-reddit_comment_writer = agents.reddit_comment_writer()
-reddit_comment_poster = agents.reddit_comment_poster()
+# Búsquedas del modo pipeline (en inglés, como la mayoría de publicaciones)
+search_queries = [
+    "AI sales agent",
+    "reduce LLM costs",
+    "AI web scraper",
+]
+
+
+def use_campaign_reference():
+    # Solo las publicaciones que más se parecen a lo que promovemos llegan al agente
+    # (las palabras clave del monitor están en inglés, como la mayoría de publicaciones)
+    set_reference(things_to_promote + "\n" + "\n".join(load_keywords(DEFAULT_KEYWORDS_FILE)))
+
+
+def build_crew(timer=None):
+    # crewai and langchain are only imported when the crew is actually used
+    from crewai import Crew, Process
+    from langchain_openai import OpenAI
+
+    from agents import RedditAgents
+    from tasks import RedditTasks
+
+    use_campaign_reference()
+    OpenAIGPT4 = OpenAI(model="gpt-4o-mini") #api_key=os.getenv("OPENAI_API_KEY")
+
+    agents = RedditAgents()
+    tasks = RedditTasks()
+
+    # Configuración de agentes
+    reddit_post_finder = agents.reddit_post_finder()
+    reddit_comment_writer = agents.reddit_comment_writer()
+    reddit_comment_poster = agents.reddit_comment_poster()
+
+    # Configuración de tareas
+    search_recent_reddit_post_task = tasks.search_recent_reddit_post_task(
+        reddit_post_finder, things_to_promote
+    )
+
+    draft_reddit_comment = tasks.draft_reddit_comment(
+        reddit_comment_writer, [search_recent_reddit_post_task]
+    )
 
-# Configuración de tareas
-search_recent_reddit_post_task = tasks.search_recent_reddit_post_task(
-    reddit_post_finder, things_to_promote
-)
+    post_reddit_comment = tasks.post_reddit_comment(
+        reddit_comment_poster, [draft_reddit_comment]
+    )
 
-draft_reddit_comment = tasks.draft_reddit_comment(
-    reddit_comment_writer, [search_recent_reddit_post_task]
-)
+    # Configuración de herramientas
+    return Crew(
+        agents=[reddit_post_finder, reddit_comment_writer, reddit_comment_poster],
+        tasks=[search_recent_reddit_post_task, draft_reddit_comment, post_reddit_comment],
+        process=Process.hierarchical,
+        manager_llm=OpenAIGPT4,
+        step_callback=timer.step_callback if timer else None,
+        task_callback=timer.task_callback if timer else None,
+    )
 
-post_reddit_comment = tasks.post_reddit_comment(
-    reddit_comment_poster, [draft_reddit_comment]
-)
 
-# Configuración de herramientas
-crew = Crew(
-    agents=[reddit_post_finder, reddit_comment_writer, reddit_comment_poster],
-    tasks=[search_recent_reddit_post_task, draft_reddit_comment, post_reddit_comment],
-    process=Process.hierarchical,
-    manager_llm=OpenAIGPT4,
-)
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Campaña de comentarios en Reddit")
+    parser.add_argument("--mode", choices=["pipeline", "crew"], default="pipeline",
+                        help="pipeline: etapas en Python y solo el borrador usa el LLM; crew: crew jerárquico")
+    args = parser.parse_args()
 
-results = crew.kickoff()
+    started = time.perf_counter()
+    if args.mode == "crew":
+        timer = CrewTimer()
+        crew = build_crew(timer)
+        timer.watch(crew)
+        timer.start()
+        results = crew.kickoff()
+        record_usage("crew", crew.usage_metrics, time.perf_counter() - started)
+    else:
+        use_campaign_reference()
+        results = run_pipeline(things_to_promote, search_queries)
+        record_usage("pipeline", None, time.perf_counter() - started)
 
-print(results)
\ No newline at end of file
+    print(results)
+    print_summary()
@@ -0,0 +1,69 @@
+# python subreddit_monitor.py --subreddits artificial MachineLearning --keywords-file keywords.txt (para detectar publicaciones en segundos)
+# Las publicaciones detectadas quedan en la cola y el agente las obtiene con 'get_monitored_posts'
+
+import argparse
+import os
+import time
+
+from dotenv import load_dotenv
+
+from tools.keyword_matcher import KeywordMatcher
+from tools.reddit_api import CANDIDATE_JOB, get_job_queue, get_rate_limiter, get_reddit
+
+load_dotenv()
+
+DEFAULT_SUBREDDITS = os.getenv("REDDIT_MONITOR_SUBREDDITS", "all").split(",")
+# Relative paths are resolved against this folder, so the scripts work from any directory
+DEFAULT_KEYWORDS_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                     os.getenv("REDDIT_MONITOR_KEYWORDS_FILE", "keywords.txt"))
+# Seconds to wait after a stream error before reconnecting
+RECONNECT_DELAY = 30
+
+
+def load_keywords(path):
+    with open(path, encoding="utf-8") as f:
+        return [line.strip() for line in f if line.strip() and not line.startswith("#")]
+
+
+def monitor(subreddits, matcher):
+    """Stream new submissions and enqueue the ones that match at least one keyword."""
+    reddit = get_reddit()
+    stream = reddit.subreddit("+".join(subreddits)).stream.submissions(skip_existing=True, pause_after=0)
+    for submission in stream:
+        if submission is None:
+            # End of one poll: let the shared limiter know how much quota the stream used
+            get_rate_limiter().update(reddit.auth.limits)
+            continue
+        if submission.locked or not submission.is_self or submission.archived:
+            continue
+        keywords = matcher.find(f"{submission.title}\n{submission.selftext}")
+        if not keywords:
+            continue
+        get_job_queue().enqueue(CANDIDATE_JOB, {
+            "title": submission.title,
+            "content": submission.selftext,
+            "url": submission.url,
+            "submission_id": submission.id,
+            "subreddit": submission.subreddit.display_name,
+            "keywords": sorted(keywords),
+            "created_utc": submission.created_utc,
+        })
+        print(f"[monitor] r/{submission.subreddit.display_name} | {submission.title} | {', '.join(sorted(keywords))}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Monitoriza subreddits y encola las publicaciones que coinciden con las palabras clave")
+    parser.add_argument("--subreddits", nargs="+", default=DEFAULT_SUBREDDITS)
+    parser.add_argument("--keywords-file", default=DEFAULT_KEYWORDS_FILE, help="una palabra clave por línea")
+    args = parser.parse_args()
+
+    matcher = KeywordMatcher(load_keywords(args.keywords_file))
+    print(f"Monitorizando r/{'+'.join(args.subreddits)} con {len(matcher.keywords)} palabras clave")
+    while True:
+        try:
+            monitor(args.subreddits, matcher)
+        except KeyboardInterrupt:
+            break
+        except Exception as e:
+            print(f"[monitor] error en el stream: {e}; reconectando en {RECONNECT_DELAY} s")
+            time.sleep(RECONNECT_DELAY)
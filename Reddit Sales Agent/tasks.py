@@ -40,8 +40,8 @@ class RedditTasks:
     
     def post_reddit_comment(self, agent, context):
         return Task(
-            description="Publicar el comentario generado desde draft_reddit_comment en la publicación de Reddit basado en el submission_id",
+            description="Programar el comentario generado desde draft_reddit_comment en la publicación de Reddit basado en el submission_id",
             agent=agent,
             context=context,
-            expected_output = "La URL del comentario que fue publicado en la publicación de Reddit",
+            expected_output = "El job_id y la hora programada (scheduled_for) de cada comentario en la cola",
         )
\ No newline at end of file
@@ -0,0 +1,142 @@
+import json
+import re
+import threading
+import time
+from typing import Any, Dict, List
+
+
+class _Subreddit:
+    def __init__(self, name):
+        self.display_name = name
+
+
+class FakeSubmission:
+    def __init__(self, reddit, data: Dict[str, Any]):
+        self._reddit = reddit
+        self.id = data["id"]
+        self.title = data.get("title", "")
+        self.selftext = data.get("selftext", "")
+        self.url = data.get("url") or f"https://www.reddit.com/comments/{self.id}/"
+        self.is_self = data.get("is_self", True)
+        self.locked = data.get("locked", False)
+        self.archived = data.get("archived", False)
+        self.created_utc = data.get("created_utc", time.time())
+        self.subreddit = _Subreddit(data.get("subreddit", "test"))
+
+    def reply(self, message):
+        return self._reddit._reply(self.id, message)
+
+
+class FakeComment:
+    def __init__(self, comment_id, submission_id):
+        self.id = comment_id
+        self.permalink = f"/comments/{submission_id}/_/{comment_id}/"
+
+
+class _Stream:
+    def __init__(self, subreddit):
+        self._subreddit = subreddit
+
+    def submissions(self, skip_existing=False, pause_after=None):
+        # Recorded posts are replayed once; there is nothing "existing" to skip offline
+        yield from self._subreddit._matching()
+        if pause_after is not None:
+            yield None
+
+
+class FakeSubredditModel:
+    def __init__(self, reddit, name):
+        self._reddit = reddit
+        self.names = {part.lower() for part in name.split("+")}
+        self.stream = _Stream(self)
+
+    def _matching(self):
+        return [submission for submission in self._reddit._submissions.values()
+                if "all" in self.names or submission.subreddit.display_name.lower() in self.names]
+
+    def search(self, query, time_filter=None, sort=None, limit=100):
+        """Every query word must appear in the title or body, like Reddit's default search."""
+        self._reddit._request()
+        terms = re.findall(r"\w+", query.lower())
+        hits = [submission for submission in self._matching()
+                if all(term in f"{submission.title} {submission.selftext}".lower() for term in terms)]
+        hits.sort(key=lambda submission: -submission.created_utc)
+        return iter(hits[:limit])
+
+
+class _Auth:
+    def __init__(self, reddit):
+        self._reddit = reddit
+
+    @property
+    def limits(self):
+        return {"remaining": None, "reset_timestamp": None, "used": self._reddit.requests}
+
+
+class FakeReddit:
+    """Offline stand-in for `praw.Reddit` serving recorded submissions.
+
+    Covers what the tools use: search, info, submission(...).reply, subreddit streams and
+    auth.limits. Every API call sleeps `latency` seconds and is counted in `requests`;
+    replies are kept in `replies` instead of being posted.
+    """
+
+    def __init__(self, submissions: List[Dict[str, Any]], latency: float = 0.0):
+        self.latency = latency
+        self.requests = 0
+        self.replies: List[Dict[str, str]] = []
+        self._lock = threading.Lock()
+        self._submissions = {data["id"]: FakeSubmission(self, data) for data in submissions}
+        self.auth = _Auth(self)
+
+    @classmethod
+    def from_json(cls, path: str, latency: float = 0.0) -> "FakeReddit":
+        with open(path, encoding="utf-8") as f:
+            return cls(json.load(f), latency)
+
+    def _request(self):
+        with self._lock:
+            self.requests += 1
+        if self.latency:
+            time.sleep(self.latency)
+
+    def _reply(self, submission_id, message):
+        self._request()
+        with self._lock:
+            comment = FakeComment(f"c{len(self.replies) + 1}", submission_id)
+            self.replies.append({"submission_id": submission_id, "comment_id": comment.id, "message": message})
+        return comment
+
+    def subreddit(self, name):
+        return FakeSubredditModel(self, name)
+
+    def submission(self, id=None):
+        if id not in self._submissions:
+            raise ValueError(f"Unknown submission {id}")
+        return self._submissions[id]
+
+    def info(self, fullnames=None):
+        self._request()
+        ids = [fullname.split("_", 1)[1] for fullname in fullnames or []]
+        return iter([self._submissions[submission_id] for submission_id in ids if submission_id in self._submissions])
+
+
+def record_submissions(reddit, queries: List[str], path: str, limit: int = 100) -> int:
+    """Save real search results in the JSON format FakeReddit.from_json reads."""
+    recorded = {}
+    for query in queries:
+        for submission in reddit.subreddit("all").search(query, time_filter="week", sort="new", limit=limit):
+            recorded[submission.id] = {
+                "id": submission.id,
+                "title": submission.title,
+                "selftext": submission.selftext,
+                "url": submission.url,
+                "is_self": submission.is_self,
+                "locked": submission.locked,
+                "archived": submission.archived,
+                "created_utc": submission.created_utc,
+                "subreddit": submission.subreddit.display_name,
+            }
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(list(recorded.values()), f, ensure_ascii=False, indent=2)
+    return len(recorded)
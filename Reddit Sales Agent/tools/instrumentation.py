@@ -0,0 +1,155 @@
+import functools
+import json
+import os
+import threading
+import time
+from collections import defaultdict
+from typing import Any, Dict, Optional
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+METRICS_PATH = os.getenv("REDDIT_METRICS_FILE", "reddit_metrics.jsonl")
+
+_lock = threading.Lock()
+# Aggregates per (kind, name) for the end-of-run summary
+_totals: Dict[tuple, Dict[str, float]] = defaultdict(
+    lambda: {"calls": 0, "errors": 0, "seconds": 0.0, "prompt_tokens": 0, "completion_tokens": 0}
+)
+
+
+def record(kind: str, name: str, seconds: float = 0.0, error: Optional[str] = None,
+           prompt_tokens: int = 0, completion_tokens: int = 0, **extra: Any) -> None:
+    """Append one JSON line to METRICS_PATH and add it to the run totals."""
+    event = {"ts": round(time.time(), 3), "kind": kind, "name": name, "seconds": round(seconds, 4)}
+    if error:
+        event["error"] = error
+    if prompt_tokens or completion_tokens:
+        event["prompt_tokens"] = prompt_tokens
+        event["completion_tokens"] = completion_tokens
+    event.update(extra)
+    with _lock:
+        totals = _totals[(kind, name)]
+        totals["calls"] += 1
+        totals["errors"] += bool(error)
+        totals["seconds"] += seconds
+        totals["prompt_tokens"] += prompt_tokens
+        totals["completion_tokens"] += completion_tokens
+        with open(METRICS_PATH, "a", encoding="utf-8") as f:
+            f.write(json.dumps(event, ensure_ascii=False) + "\n")
+
+
+def instrumented(name: str, kind: str = "tool"):
+    """Time every call; tools report failures as {"error": ...} so those count as errors too.
+
+    Goes below @tool so crewai still sees the original signature and docstring.
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            started = time.perf_counter()
+            try:
+                result = func(*args, **kwargs)
+            except Exception as e:
+                record(kind, name, time.perf_counter() - started, error=str(e))
+                raise
+            error = result.get("error") if isinstance(result, dict) else None
+            record(kind, name, time.perf_counter() - started, error=error)
+            return result
+        return wrapper
+    return decorator
+
+
+def _agent_tokens(agent) -> tuple:
+    """(prompt, completion) tokens an agent's LLM has used so far, across crewai versions."""
+    llm = getattr(agent, "llm", None)
+    if hasattr(llm, "get_token_usage_summary"):
+        usage = llm.get_token_usage_summary()
+    else:
+        process = getattr(agent, "_token_process", None)
+        usage = process.get_summary() if process is not None else None
+    return (getattr(usage, "prompt_tokens", 0) or 0, getattr(usage, "completion_tokens", 0) or 0)
+
+
+class CrewTimer:
+    """crewai `step_callback`/`task_callback` pair recording time, steps and tokens per agent.
+
+    Tasks run one after another, so a task's time is measured from the end of the previous
+    one (or from `start()`), and the steps counted in between belong to its agent. Tokens are
+    the growth of each agent's LLM usage since the previous task; agents the manager delegated
+    to get their own row.
+    """
+
+    def __init__(self):
+        self.crew = None
+        self.start()
+
+    def watch(self, crew):
+        """Track the token usage of `crew`'s agents (the manager is looked up at each task)."""
+        self.crew = crew
+        self._tokens = self._snapshot()
+
+    def start(self):
+        self._last = time.perf_counter()
+        self._steps = 0
+        self._tokens = self._snapshot()
+
+    def _agents(self):
+        if self.crew is None:
+            return []
+        agents = list(getattr(self.crew, "agents", None) or [])
+        manager = getattr(self.crew, "manager_agent", None)
+        return agents + [manager] if manager is not None else agents
+
+    def _snapshot(self):
+        return {str(getattr(agent, "role", agent)): _agent_tokens(agent) for agent in self._agents()}
+
+    def step_callback(self, step_output):
+        self._steps += 1
+        record("step", type(step_output).__name__)
+
+    def task_callback(self, task_output):
+        now = time.perf_counter()
+        agent = str(getattr(task_output, "agent", None) or "unknown")
+        tokens = self._snapshot()
+        used = {}
+        for role, (prompt, completion) in tokens.items():
+            before = self._tokens.get(role, (0, 0))
+            if (prompt, completion) != before:
+                used[role] = (prompt - before[0], completion - before[1])
+        prompt, completion = used.pop(agent, (0, 0))
+        record("agent", agent, now - self._last, prompt_tokens=prompt, completion_tokens=completion,
+               steps=self._steps, output_chars=len(str(getattr(task_output, "raw", "") or "")))
+        for role, (prompt, completion) in used.items():
+            record("agent", role, 0.0, prompt_tokens=prompt, completion_tokens=completion, task_agent=agent)
+        self._last = now
+        self._steps = 0
+        self._tokens = tokens
+
+
+def record_usage(name: str, usage: Any, seconds: float) -> None:
+    """Record a crew's `usage_metrics` (or any object/dict with prompt/completion token counts)."""
+    if usage is None:
+        record("run", name, seconds)
+        return
+    if not isinstance(usage, dict):
+        usage = usage.model_dump() if hasattr(usage, "model_dump") else vars(usage)
+    record("run", name, seconds, prompt_tokens=usage.get("prompt_tokens") or 0,
+           completion_tokens=usage.get("completion_tokens") or 0,
+           successful_requests=usage.get("successful_requests"))
+
+
+def print_summary() -> None:
+    with _lock:
+        rows = sorted(_totals.items(), key=lambda item: -item[1]["seconds"])
+    if not rows:
+        return
+    print("\nResumen de tiempos (más lento primero):")
+    print(f"{'tipo':<6} {'nombre':<42} {'llamadas':>8} {'errores':>7} {'total s':>9} {'media s':>8} {'tokens':>8}")
+    for (kind, name), totals in rows:
+        mean = totals["seconds"] / totals["calls"] if totals["calls"] else 0
+        tokens = totals["prompt_tokens"] + totals["completion_tokens"]
+        print(f"{kind:<6} {name[:42]:<42} {totals['calls']:>8} {totals['errors']:>7} "
+              f"{totals['seconds']:>9.2f} {mean:>8.2f} {tokens:>8}")
+    print(f"Detalle por llamada en {METRICS_PATH}")
@@ -0,0 +1,131 @@
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, List, Optional
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+DEFAULT_QUEUE_DB = os.getenv("REDDIT_QUEUE_DB", "reddit_jobs.db")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    kind TEXT NOT NULL,
+    payload TEXT NOT NULL,
+    not_before REAL NOT NULL,
+    status TEXT NOT NULL DEFAULT 'pending',
+    attempts INTEGER NOT NULL DEFAULT 0,
+    result TEXT,
+    created_at REAL NOT NULL,
+    updated_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_jobs_due ON jobs (kind, status, not_before);
+"""
+
+
+class JobQueue:
+    """Persistent SQLite job queue shared by the crew (producer) and worker processes.
+
+    Jobs carry a `not_before` timestamp; workers only claim jobs that are due, and claims
+    run in an IMMEDIATE transaction so two workers never take the same job.
+    """
+
+    def __init__(self, path: str = DEFAULT_QUEUE_DB):
+        self.path = path
+        self._lock = threading.Lock()
+        self.conn = sqlite3.connect(path, timeout=30, check_same_thread=False, isolation_level=None)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.executescript(_SCHEMA)
+
+    def enqueue(self, kind: str, payload: Dict[str, Any], not_before: Optional[float] = None) -> int:
+        now = time.time()
+        with self._lock:
+            cursor = self.conn.execute(
+                "INSERT INTO jobs (kind, payload, not_before, created_at, updated_at) VALUES (?, ?, ?, ?, ?)",
+                (kind, json.dumps(payload, ensure_ascii=False), not_before or now, now, now),
+            )
+        return cursor.lastrowid
+
+    def next_slot(self, kind: str, spacing_seconds: float) -> float:
+        """Earliest time a new job of `kind` can run while keeping `spacing_seconds` between jobs."""
+        with self._lock:
+            row = self.conn.execute(
+                "SELECT MAX(not_before) FROM jobs WHERE kind = ? AND status IN ('pending', 'running', 'done')",
+                (kind,),
+            ).fetchone()
+        last = row[0] or 0
+        return max(time.time(), last + spacing_seconds)
+
+    def claim_due(self, kind: str, limit: int = 1) -> List[Dict[str, Any]]:
+        now = time.time()
+        with self._lock:
+            self.conn.execute("BEGIN IMMEDIATE")
+            try:
+                rows = self.conn.execute(
+                    "SELECT id, payload, attempts FROM jobs WHERE kind = ? AND status = 'pending' "
+                    "AND not_before <= ? ORDER BY not_before LIMIT ?",
+                    (kind, now, limit),
+                ).fetchall()
+                self.conn.executemany(
+                    "UPDATE jobs SET status = 'running', attempts = attempts + 1, updated_at = ? WHERE id = ?",
+                    [(now, row[0]) for row in rows],
+                )
+                self.conn.execute("COMMIT")
+            except Exception:
+                self.conn.execute("ROLLBACK")
+                raise
+        return [{"id": row[0], "payload": json.loads(row[1]), "attempts": row[2] + 1} for row in rows]
+
+    def complete(self, job_id: int, result: Dict[str, Any]) -> None:
+        self._finish(job_id, "done", result)
+
+    def fail(self, job_id: int, error: str, retry_at: Optional[float] = None) -> None:
+        """Mark a job failed, or put it back in the queue when `retry_at` is given."""
+        if retry_at is None:
+            self._finish(job_id, "failed", {"error": error})
+            return
+        with self._lock:
+            self.conn.execute(
+                "UPDATE jobs SET status = 'pending', not_before = ?, result = ?, updated_at = ? WHERE id = ?",
+                (retry_at, json.dumps({"error": error}), time.time(), job_id),
+            )
+
+    def _finish(self, job_id: int, status: str, result: Dict[str, Any]) -> None:
+        with self._lock:
+            self.conn.execute(
+                "UPDATE jobs SET status = ?, result = ?, updated_at = ? WHERE id = ?",
+                (status, json.dumps(result, ensure_ascii=False), time.time(), job_id),
+            )
+
+    def requeue_stale(self, kind: str, claim_timeout: float) -> int:
+        """Put back jobs left "running" longer than `claim_timeout`, e.g. by a worker that crashed.
+
+        A job whose work finished right before the crash runs again, so `claim_timeout`
+        must be well above the time one job can take.
+        """
+        now = time.time()
+        with self._lock:
+            cursor = self.conn.execute(
+                "UPDATE jobs SET status = 'pending', updated_at = ? "
+                "WHERE kind = ? AND status = 'running' AND updated_at < ?",
+                (now, kind, now - claim_timeout),
+            )
+        return cursor.rowcount
+
+    def last_completed_at(self, kind: str) -> Optional[float]:
+        with self._lock:
+            row = self.conn.execute(
+                "SELECT MAX(updated_at) FROM jobs WHERE kind = ? AND status = 'done'", (kind,)
+            ).fetchone()
+        return row[0]
+
+    def next_due_at(self, kind: str) -> Optional[float]:
+        with self._lock:
+            row = self.conn.execute(
+                "SELECT MIN(not_before) FROM jobs WHERE kind = ? AND status = 'pending'", (kind,)
+            ).fetchone()
+        return row[0]
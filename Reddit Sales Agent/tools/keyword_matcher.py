@@ -0,0 +1,61 @@
+from collections import deque
+from typing import Dict, Iterable, List, Set
+
+
+class KeywordMatcher:
+    """Aho-Corasick automaton: finds every keyword in a text in one pass, whatever the keyword count.
+
+    Matching is case-insensitive and only whole words count, so "ai" does not match "said".
+    """
+
+    def __init__(self, keywords: Iterable[str]):
+        self.keywords: List[str] = []
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        # Keywords (by index) ending at each state, including those reached via fail links
+        self._out: List[List[int]] = [[]]
+        for keyword in keywords:
+            keyword = " ".join(keyword.lower().split())
+            if keyword and keyword not in self.keywords:
+                self._add(keyword, len(self.keywords))
+                self.keywords.append(keyword)
+        self._build_fail_links()
+
+    def _add(self, keyword: str, index: int) -> None:
+        state = 0
+        for char in keyword:
+            if char not in self._goto[state]:
+                self._goto.append({})
+                self._fail.append(0)
+                self._out.append([])
+                self._goto[state][char] = len(self._goto) - 1
+            state = self._goto[state][char]
+        self._out[state].append(index)
+
+    def _build_fail_links(self) -> None:
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, child in self._goto[state].items():
+                queue.append(child)
+                fallback = self._fail[state]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                self._fail[child] = self._goto[fallback].get(char, 0)
+                self._out[child] = self._out[child] + self._out[self._fail[child]]
+
+    def find(self, text: str) -> Set[str]:
+        """Keywords present in `text` as whole words."""
+        text = " ".join(text.lower().split())
+        found: Set[int] = set()
+        state = 0
+        for end, char in enumerate(text):
+            while state and char not in self._goto[state]:
+                state = self._fail[state]
+            state = self._goto[state].get(char, 0)
+            for index in self._out[state]:
+                start = end - len(self.keywords[index]) + 1
+                if (start == 0 or not text[start - 1].isalnum()) and \
+                        (end + 1 == len(text) or not text[end + 1].isalnum()):
+                    found.add(index)
+        return {self.keywords[index] for index in found}
@@ -0,0 +1,157 @@
+import os
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Optional
+
+from dotenv import load_dotenv
+
+from tools.instrumentation import record
+
+load_dotenv()
+
+# Reddit allows 100 requests per minute per OAuth client
+DEFAULT_RATE_PER_MIN = float(os.getenv("REDDIT_RATE_LIMIT_PER_MIN", "100"))
+DEFAULT_BURST = int(os.getenv("REDDIT_RATE_BURST", "10"))
+# Requests kept in reserve so other clients sharing the account don't hit a 429
+QUOTA_RESERVE = 2
+# Used when a 429 comes back without a Retry-After header
+DEFAULT_BACKOFF_SECONDS = 60
+
+
+class RateLimiter:
+    """Process-wide token bucket for the Reddit API, paced by the quota Reddit reports.
+
+    Every request takes a token first. After each request the limiter reads
+    `reddit.auth.limits` (X-Ratelimit-Remaining) plus the X-Ratelimit-Reset header and
+    slows the refill down so the remaining quota is spread evenly over what is left of the
+    window. Without a known reset time only the configured rate applies.
+    """
+
+    def __init__(self, rate_per_min: float = DEFAULT_RATE_PER_MIN, burst: int = DEFAULT_BURST):
+        self.rate = rate_per_min / 60
+        self.capacity = burst
+        self.tokens = float(burst)
+        self.updated = time.monotonic()
+        self.remaining: Optional[float] = None
+        self.reset_at: Optional[float] = None
+        # A 429 pause can't be loosened by quota read from later responses
+        self.backoff_until = 0.0
+        self._lock = threading.Lock()
+
+    def _current_rate(self) -> float:
+        if self.remaining is None or self.reset_at is None:
+            return self.rate
+        seconds_left = self.reset_at - time.time()
+        if seconds_left <= 0:
+            # The window is over; the next response will tell us the new quota
+            self.remaining = self.reset_at = None
+            return self.rate
+        return min(self.rate, max(self.remaining - QUOTA_RESERVE, 0) / seconds_left)
+
+    def _refill(self) -> float:
+        now = time.monotonic()
+        rate = self._current_rate()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * rate)
+        self.updated = now
+        return rate
+
+    def acquire(self) -> None:
+        """Block until a request may be sent."""
+        while True:
+            with self._lock:
+                rate = self._refill()
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    if self.remaining is not None:
+                        self.remaining -= 1
+                    return
+                if rate > 0:
+                    wait = (1 - self.tokens) / rate
+                else:
+                    wait = max(self.reset_at - time.time(), 0.1)
+            time.sleep(wait)
+
+    def update(self, limits: Dict[str, Any], reset_timestamp: Optional[float] = None) -> None:
+        """Record the quota from `reddit.auth.limits` after a request.
+
+        Older PRAW versions expose `reset_timestamp` in the limits; for newer ones it comes
+        from `reset_timestamp_of`. When the reset is unknown the quota doesn't slow us down.
+        """
+        if limits.get("remaining") is None:
+            return
+        reset_timestamp = limits.get("reset_timestamp") or reset_timestamp
+        with self._lock:
+            if time.time() < self.backoff_until:
+                return
+            self._refill()
+            if reset_timestamp and reset_timestamp > time.time():
+                self.remaining = limits["remaining"]
+                self.reset_at = reset_timestamp
+            else:
+                self.remaining = self.reset_at = None
+
+    def backoff(self, seconds: Any) -> None:
+        """Stop all requests for `seconds` after a 429 (prawcore gives Retry-After as a string)."""
+        try:
+            seconds = float(seconds) if seconds else DEFAULT_BACKOFF_SECONDS
+        except ValueError:
+            seconds = DEFAULT_BACKOFF_SECONDS
+        with self._lock:
+            self._refill()
+            self.tokens = 0
+            self.remaining = 0
+            self.reset_at = self.backoff_until = time.time() + seconds
+
+    @contextmanager
+    def limit(self, reddit, name: str = "request"):
+        """Wrap the code that sends one Reddit request (lazy PRAW objects fetch on attribute access).
+
+        Time spent waiting for a token and time spent on the request are recorded separately.
+        """
+        # Hooks the X-Ratelimit-Reset header before the first request goes out
+        reset_timestamp_of(reddit)
+        started = time.perf_counter()
+        self.acquire()
+        waited = time.perf_counter() - started
+        if waited > 0.001:
+            record("wait", f"rate_limit:{name}", waited)
+        started = time.perf_counter()
+        error = None
+        throttled = False
+        try:
+            yield
+        except Exception as e:
+            error = str(e)
+            # Matched by name so this module doesn't import prawcore
+            if type(e).__name__ == "TooManyRequests":
+                throttled = True
+                self.backoff(getattr(e, "retry_after", None))
+            raise
+        finally:
+            record("reddit", name, time.perf_counter() - started, error=error)
+            # After a 429 the client's quota is stale and would cancel the pause
+            if not throttled:
+                self.update(reddit.auth.limits, reset_timestamp_of(reddit))
+
+
+def reset_timestamp_of(reddit) -> Optional[float]:
+    """Epoch time at which Reddit's quota window resets, from the last X-Ratelimit-Reset header.
+
+    prawcore reads the header but doesn't keep it, so its limiter's `update` is wrapped
+    once per client to remember it. Returns None for clients without a prawcore session.
+    """
+    limiter = getattr(getattr(reddit, "_core", None), "rate_limiter", None)
+    if limiter is None:
+        return None
+    if not hasattr(limiter, "reset_timestamp"):
+        original_update = limiter.update
+
+        def update(*, response_headers):
+            original_update(response_headers=response_headers)
+            if "x-ratelimit-reset" in response_headers:
+                limiter.reset_timestamp = time.time() + float(response_headers["x-ratelimit-reset"])
+
+        limiter.reset_timestamp = None
+        limiter.update = update
+    return limiter.reset_timestamp
@@ -0,0 +1,228 @@
+from dotenv import load_dotenv
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+import os
+import threading
+from typing import Dict, Any, List
+
+from tools.job_queue import JobQueue
+from tools.rate_limiter import RateLimiter
+from tools.relevance import rank_posts
+from tools.seen_index import EVALUATED, REPLIED, SeenIndex
+
+load_dotenv()
+
+REPLY_JOB = "reply_to_reddit_post"
+# Posts found by subreddit_monitor.py, waiting for the agents
+CANDIDATE_JOB = "candidate_post"
+# Candidates fetched per call; only the best ranked ones are handed to the agent
+CANDIDATE_LIMIT = int(os.getenv("REDDIT_CANDIDATE_LIMIT", "50"))
+# Maximum fullnames Reddit resolves in one /api/info request
+INFO_BATCH_SIZE = 100
+# Minimum time between two published comments (otherwise it looks like spam)
+REPLY_SPACING_MINS = float(os.getenv("REDDIT_REPLY_SPACING_MINS", "10"))
+# Searches running at the same time in the multi-keyword tool
+SEARCH_CONCURRENCY = int(os.getenv("REDDIT_SEARCH_CONCURRENCY", "4"))
+
+
+_reddit = None
+_injected = False
+# PRAW instances aren't thread-safe: each search thread gets its own client. The pool is
+# kept for the whole process so those clients (and their OAuth tokens) are reused
+_thread_clients = threading.local()
+_search_executor = None
+_executor_lock = threading.Lock()
+# Queue, limiter and seen index are created on first use so importing doesn't open SQLite files
+_job_queue = None
+_rate_limiter = None
+_seen_index = None
+_state_lock = threading.Lock()
+
+
+def make_reddit():
+    # Imported here so importing the tools doesn't pay for PRAW and its HTTP stack
+    import praw
+
+    return praw.Reddit(
+        client_id=os.getenv("REDDIT_CLIENT_ID"),
+        client_secret=os.getenv("REDDIT_CLIENT_SECRET"),
+        user_agent=os.getenv("REDDIT_USER_AGENT"),
+        username=os.getenv("REDDIT_USERNAME"),
+        password=os.getenv("REDDIT_PASSWORD"),
+    )
+
+
+def get_reddit():
+    """Client used by every Reddit call, created on first use."""
+    global _reddit
+    if _reddit is None:
+        _reddit = make_reddit()
+    return _reddit
+
+
+def set_reddit_client(client) -> None:
+    """Replace the client for the whole process, e.g. with tools.fake_reddit.FakeReddit for offline runs."""
+    global _reddit, _injected
+    _reddit = client
+    _injected = True
+
+
+def thread_reddit():
+    if _injected:
+        return get_reddit()
+    if not hasattr(_thread_clients, "reddit"):
+        _thread_clients.reddit = make_reddit()
+    return _thread_clients.reddit
+
+
+def search_executor() -> ThreadPoolExecutor:
+    global _search_executor
+    with _executor_lock:
+        if _search_executor is None:
+            _search_executor = ThreadPoolExecutor(max_workers=SEARCH_CONCURRENCY, thread_name_prefix="reddit-search")
+    return _search_executor
+
+
+def get_job_queue() -> JobQueue:
+    """Queue of scheduled replies and monitored candidates."""
+    global _job_queue
+    with _state_lock:
+        if _job_queue is None:
+            _job_queue = JobQueue()
+    return _job_queue
+
+
+def get_rate_limiter() -> RateLimiter:
+    """Shared by every tool and by comment_worker.py so requests are paced before Reddit answers 429."""
+    global _rate_limiter
+    with _state_lock:
+        if _rate_limiter is None:
+            _rate_limiter = RateLimiter()
+    return _rate_limiter
+
+
+def get_seen_index() -> SeenIndex:
+    """Submissions already handed to the agents or replied to, so later runs skip them."""
+    global _seen_index
+    with _state_lock:
+        if _seen_index is None:
+            _seen_index = SeenIndex()
+    return _seen_index
+
+
+def set_state(job_queue: JobQueue = None, rate_limiter: RateLimiter = None, seen_index: SeenIndex = None) -> None:
+    """Replace the queue, limiter or seen index for the whole process, e.g. with temporary files for a benchmark."""
+    global _job_queue, _rate_limiter, _seen_index
+    with _state_lock:
+        if job_queue is not None:
+            _job_queue = job_queue
+        if rate_limiter is not None:
+            _rate_limiter = rate_limiter
+        if seen_index is not None:
+            _seen_index = seen_index
+
+
+def select_new_posts(posts, top_k=None, mark=True):
+    """Drop posts seen in earlier runs, keep the `top_k` best ranked and (with `mark`) remember them as evaluated."""
+    new_posts = [post for post in posts if get_seen_index().stage(post["submission_id"]) is None]
+    ranked = rank_posts(new_posts, top_k)
+    if mark:
+        get_seen_index().mark([post["submission_id"] for post in ranked], EVALUATED)
+    return ranked
+
+
+def search_posts(keywords: str, client=None) -> List[Dict[str, str]]:
+    """Self posts from the last hour matching `keywords`, newest first, not ranked or deduped."""
+    client = client or get_reddit()
+    # Up to 100 results fit in a single listing request
+    with get_rate_limiter().limit(client, "search"):
+        results = list(client.subreddit("all").search(
+            keywords, time_filter="hour", sort="new", limit=min(CANDIDATE_LIMIT, 100)
+        ))
+    posts = []
+    for submission in results:
+        if not submission.locked and submission.is_self and not submission.archived:
+            post = {
+                "title": submission.title,
+                "content": submission.selftext,
+                "url": submission.url,
+                "submission_id": submission.id,
+            }
+            posts.append(post)
+    return posts
+
+
+def search_posts_multi(keyword_sets: List[str]):
+    """Run the searches on a bounded thread pool; returns posts merged by id plus errors per search."""
+    def search(keywords):
+        try:
+            return keywords, search_posts(keywords, thread_reddit()), None
+        except Exception as e:
+            return keywords, [], str(e)
+
+    results = list(search_executor().map(search, keyword_sets))
+
+    merged, errors = {}, {}
+    for keywords, posts, error in results:
+        if error:
+            errors[keywords] = error
+        for post in posts:
+            merged.setdefault(post["submission_id"], dict(post, matched_keywords=[]))
+            merged[post["submission_id"]]["matched_keywords"].append(keywords)
+    return list(merged.values()), errors
+
+
+def drain_monitored_posts() -> List[Dict[str, Any]]:
+    """Posts enqueued by subreddit_monitor.py; each one is handed out only once."""
+    jobs = get_job_queue().claim_due(CANDIDATE_JOB, limit=CANDIDATE_LIMIT)
+    for job in jobs:
+        get_job_queue().complete(job["id"], {"status": "delivered"})
+    return [job["payload"] for job in jobs]
+
+
+def post_content(submission) -> Dict[str, str]:
+    content = submission.selftext if submission.is_self else f"Link post content: {submission.url}"
+    return {
+        "content": content,
+        "title": submission.title,
+        "url": submission.url
+    }
+
+
+def fetch_posts(submission_ids: List[str]) -> Dict[str, Dict[str, str]]:
+    """Resolve many submissions with one /api/info request per 100 ids, keyed by id."""
+    reddit = get_reddit()
+    posts = {}
+    for start in range(0, len(submission_ids), INFO_BATCH_SIZE):
+        chunk = submission_ids[start:start + INFO_BATCH_SIZE]
+        with get_rate_limiter().limit(reddit, "info"):
+            submissions = list(reddit.info(fullnames=[f"t3_{submission_id}" for submission_id in chunk]))
+        for submission in submissions:
+            posts[submission.id] = post_content(submission)
+    return posts
+
+
+def reply_to_post(submission_id: str, message: str) -> Dict[str, str]:
+    """Publish a comment right away; raises on Reddit errors so callers can retry."""
+    reddit = get_reddit()
+    with get_rate_limiter().limit(reddit, "reply"):
+        comment = reddit.submission(id=submission_id).reply(message)
+    get_seen_index().mark([submission_id], REPLIED)
+    return {
+        "status": "success",
+        "url": f"https://www.reddit.com{comment.permalink}",
+        "comment_id": comment.id
+    }
+
+def schedule_reply(submission_id: str, message: str) -> Dict[str, str]:
+    """Enqueue a reply for comment_worker.py, spaced REDDIT_REPLY_SPACING_MINS after the previous one."""
+    if get_seen_index().stage(submission_id) == REPLIED:
+        return {"status": "skipped", "reason": "Ya hay un comentario programado o publicado en esta publicación"}
+    not_before = get_job_queue().next_slot(REPLY_JOB, REPLY_SPACING_MINS * 60)
+    job_id = get_job_queue().enqueue(REPLY_JOB, {"submission_id": submission_id, "message": message}, not_before)
+    get_seen_index().mark([submission_id], REPLIED)
+    return {
+        "status": "scheduled",
+        "job_id": str(job_id),
+        "scheduled_for": datetime.fromtimestamp(not_before).isoformat(timespec="seconds")
+    }
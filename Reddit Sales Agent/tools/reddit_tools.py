@@ -1,68 +1,107 @@
-import praw
 from crewai.tools import tool
-from dotenv import load_dotenv
-import os
-from typing import Dict, Any
+from typing import Dict, Any, List
 
-load_dotenv()
-
-reddit = praw.Reddit(
-    client_id=os.getenv("REDDIT_CLIENT_ID"),
-    client_secret=os.getenv("REDDIT_CLIENT_SECRET"),
-    user_agent=os.getenv("REDDIT_USER_AGENT"),
-    username=os.getenv("REDDIT_USERNAME"),
-    password=os.getenv("REDDIT_PASSWORD"),
+from tools.instrumentation import instrumented
+from tools.reddit_api import (
+    REPLIED,
+    drain_monitored_posts,
+    fetch_posts,
+    get_rate_limiter,
+    get_reddit,
+    get_seen_index,
+    post_content,
+    reply_to_post,
+    schedule_reply,
+    search_posts,
+    search_posts_multi,
+    select_new_posts,
 )
 
+
 class RedditTools:
     @staticmethod
     @tool("Buscar publicaciones recientes de reddit")
+    @instrumented("search_recent_reddit_post")
     def search_recent_reddit_post(keywords: str) -> Dict[str, Any]:
         """Buscar publicaciones recientes de reddit basadas en palabras clave"""
         try:
-            subreddit = reddit.subreddit("all")
-            posts = []
-            for submission in subreddit.search(
-                keywords, time_filter="hour", sort="new", limit=5
-            ):
-                if not submission.locked and submission.is_self and not submission.archived:
-                    post = {
-                        "title": submission.title,
-                        "content": submission.selftext,
-                        "url": submission.url,
-                        "submission_id": submission.id,
-                    }
-                    posts.append(post)
-            return {"posts": posts}  # Return as a dictionary
+            return {"posts": select_new_posts(search_posts(keywords))}  # Return as a dictionary
+        except Exception as e:
+            return {"error": str(e)}
+
+    @staticmethod
+    @tool("Buscar publicaciones recientes de reddit para varias palabras clave")
+    @instrumented("search_recent_reddit_posts_multi")
+    def search_recent_reddit_posts_multi(keyword_sets: List[str]) -> Dict[str, Any]:
+        """Buscar publicaciones recientes de reddit para varias búsquedas a la vez (una por elemento de la lista); devuelve los resultados combinados y sin duplicados"""
+        try:
+            posts, errors = search_posts_multi(keyword_sets)
+            response = {"posts": select_new_posts(posts)}
+            if errors:
+                response["errors"] = errors
+            return response
+        except Exception as e:
+            return {"error": str(e)}
+
+    @staticmethod
+    @tool("Obtener publicaciones detectadas por el monitor")
+    @instrumented("get_monitored_posts")
+    def get_monitored_posts() -> Dict[str, Any]:
+        """Obtener las publicaciones nuevas más relevantes que subreddit_monitor.py encontró con las palabras clave (cada publicación se entrega una sola vez)"""
+        try:
+            return {"posts": select_new_posts(drain_monitored_posts())}
         except Exception as e:
             return {"error": str(e)}
 
     @staticmethod
     @tool("Obtener contenido de publicación de reddit")
+    @instrumented("fetch_reddit_post_content")
     def fetch_reddit_post_content(submission_id: str) -> Dict[str, str]:
         """Obtener el contenido de una publicación de Reddit dado su ID"""
+        if get_seen_index().stage(submission_id) == REPLIED:
+            return {"error": "Ya comentamos en esta publicación; pasa a la siguiente"}
         try:
-            submission = reddit.submission(id=submission_id)
-            content = submission.selftext if submission.is_self else f"Link post content: {submission.url}"
+            reddit = get_reddit()
+            with get_rate_limiter().limit(reddit, "submission"):
+                # Attribute access triggers PRAW's lazy fetch, which must happen inside the limiter
+                return post_content(reddit.submission(id=submission_id))
+        except Exception as e:
+            return {"error": str(e)}
+
+    @staticmethod
+    @tool("Obtener contenido de varias publicaciones de reddit")
+    @instrumented("fetch_reddit_posts_content")
+    def fetch_reddit_posts_content(submission_ids: List[str]) -> Dict[str, Any]:
+        """Obtener el contenido de varias publicaciones de Reddit en una sola llamada, dada la lista de sus IDs; devuelve un diccionario por ID"""
+        try:
+            ids = [submission_id.strip() for submission_id in submission_ids if submission_id.strip()]
+            skipped = [submission_id for submission_id in ids if get_seen_index().stage(submission_id) == REPLIED]
+            posts = fetch_posts([submission_id for submission_id in ids if submission_id not in skipped])
             return {
-                "content": content,
-                "title": submission.title,
-                "url": submission.url
+                "posts": posts,
+                "already_replied": skipped,
+                "not_found": [submission_id for submission_id in ids
+                              if submission_id not in posts and submission_id not in skipped],
             }
         except Exception as e:
             return {"error": str(e)}
 
     @staticmethod
     @tool("Comentar en publicación de reddit")
+    @instrumented("reply_to_reddit_post")
     def reply_to_reddit_post(submission_id: str, message: str) -> Dict[str, str]:
         """Publicar comentario en publicación de Reddit"""
         try:
-            submission = reddit.submission(id=submission_id)
-            comment = submission.reply(message)
-            return {
-                "status": "success",
-                "url": f"https://www.reddit.com{comment.permalink}",
-                "comment_id": comment.id
-            }
+            return reply_to_post(submission_id, message)
+        except Exception as e:
+            return {"error": str(e)}
+
+    @staticmethod
+    @tool("Programar comentario en publicación de reddit")
+    @instrumented("schedule_reddit_reply")
+    def schedule_reddit_reply(submission_id: str, message: str) -> Dict[str, str]:
+        """Programar un comentario en una publicación de Reddit; comment_worker.py lo publica respetando el espaciado entre comentarios"""
+        try:
+            return schedule_reply(submission_id, message)
         except Exception as e:
             return {"error": str(e)}
\ No newline at end of file
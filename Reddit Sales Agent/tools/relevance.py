@@ -0,0 +1,67 @@
+import math
+import os
+import re
+from collections import Counter
+from typing import Any, Dict, List, Optional
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+DEFAULT_TOP_K = int(os.getenv("REDDIT_RELEVANCE_TOP_K", "5"))
+# Standard BM25 parameters
+K1 = 1.5
+B = 0.75
+
+_STOPWORDS = set("""
+a al an and are as at be by con de del el en es for from how i in is it la las los me my of on or para
+por que the this to tu un una what with y you your
+""".split())
+
+_reference_terms: Counter = Counter()
+
+
+def tokenize(text: str) -> List[str]:
+    return [token for token in re.findall(r"\w+", text.lower()) if len(token) > 1 and token not in _STOPWORDS]
+
+
+def set_reference(text: str) -> None:
+    """Text describing what we promote; candidate posts are scored against its terms."""
+    global _reference_terms
+    _reference_terms = Counter(tokenize(text))
+
+
+def bm25_scores(query_terms: Counter, documents: List[List[str]]) -> List[float]:
+    """BM25 score of every tokenized document for the query, with IDF taken from the candidates."""
+    if not documents:
+        return []
+    avg_length = sum(len(doc) for doc in documents) / len(documents) or 1
+    doc_freq = Counter(term for doc in documents for term in set(doc))
+    scores = []
+    for doc in documents:
+        term_freq = Counter(doc)
+        norm = K1 * (1 - B + B * len(doc) / avg_length)
+        score = 0.0
+        for term, weight in query_terms.items():
+            tf = term_freq.get(term)
+            if not tf:
+                continue
+            # Always positive, even for terms present in most candidates
+            idf = math.log(1 + (len(documents) - doc_freq[term] + 0.5) / (doc_freq[term] + 0.5))
+            score += weight * idf * tf * (K1 + 1) / (tf + norm)
+        scores.append(score)
+    return scores
+
+
+def rank_posts(posts: List[Dict[str, Any]], top_k: Optional[int] = None) -> List[Dict[str, Any]]:
+    """Keep the `top_k` posts whose title and content best match the reference text.
+
+    Posts sharing no term with the reference are dropped. Without a reference, posts are
+    returned unchanged.
+    """
+    if not _reference_terms:
+        return posts
+    top_k = top_k or DEFAULT_TOP_K
+    documents = [tokenize(f"{post.get('title') or ''} {post.get('content') or ''}") for post in posts]
+    scored = sorted(zip(bm25_scores(_reference_terms, documents), range(len(posts))), key=lambda pair: -pair[0])
+    return [dict(posts[i], relevance=round(score, 2)) for score, i in scored[:top_k] if score > 0]
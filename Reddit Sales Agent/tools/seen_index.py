@@ -0,0 +1,102 @@
+import hashlib
+import math
+import os
+import sqlite3
+import threading
+import time
+from typing import Iterable, Optional
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+DEFAULT_SEEN_DB = os.getenv("REDDIT_SEEN_DB", "reddit_seen.db")
+DEFAULT_TTL_DAYS = float(os.getenv("REDDIT_SEEN_TTL_DAYS", "7"))
+
+# Stages a submission goes through; "replied" is never downgraded while it is live
+EVALUATED = "evaluated"
+REPLIED = "replied"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS seen (
+    submission_id TEXT PRIMARY KEY,
+    stage TEXT NOT NULL,
+    seen_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_seen_at ON seen (seen_at);
+"""
+
+
+class BloomFilter:
+    """Fixed-size Bloom filter; `might_contain` is False only for ids that were never added."""
+
+    def __init__(self, capacity: int = 100_000, error_rate: float = 0.01):
+        self.size = max(8, int(-capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.hash_count = max(1, round(self.size / capacity * math.log(2)))
+        self.bits = bytearray((self.size + 7) // 8)
+
+    def _positions(self, key: str):
+        digest = hashlib.blake2b(key.encode("utf-8"), digest_size=16).digest()
+        h1, h2 = int.from_bytes(digest[:8], "little"), int.from_bytes(digest[8:], "little")
+        return ((h1 + i * h2) % self.size for i in range(self.hash_count))
+
+    def add(self, key: str) -> None:
+        for position in self._positions(key):
+            self.bits[position >> 3] |= 1 << (position & 7)
+
+    def might_contain(self, key: str) -> bool:
+        return all(self.bits[position >> 3] & (1 << (position & 7)) for position in self._positions(key))
+
+
+class SeenIndex:
+    """Submission ids already evaluated or replied to, persisted in SQLite with a TTL.
+
+    A Bloom filter loaded at startup answers the common "never seen" case without touching
+    the database. It only knows ids loaded at startup or added by this process, so ids
+    recorded meanwhile by another process are caught on its next run.
+    """
+
+    def __init__(self, path: str = DEFAULT_SEEN_DB, ttl_days: float = DEFAULT_TTL_DAYS):
+        self.ttl = ttl_days * 86400
+        self._lock = threading.Lock()
+        self.conn = sqlite3.connect(path, timeout=30, check_same_thread=False, isolation_level=None)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.executescript(_SCHEMA)
+        self.conn.execute("DELETE FROM seen WHERE seen_at < ?", (time.time() - self.ttl,))
+        ids = [row[0] for row in self.conn.execute("SELECT submission_id FROM seen")]
+        self.bloom = BloomFilter(capacity=max(100_000, 2 * len(ids)))
+        for submission_id in ids:
+            self.bloom.add(submission_id)
+
+    def stage(self, submission_id: str) -> Optional[str]:
+        """Stage recorded for the submission within the TTL, or None."""
+        if not self.bloom.might_contain(submission_id):
+            return None
+        with self._lock:
+            row = self.conn.execute(
+                "SELECT stage FROM seen WHERE submission_id = ? AND seen_at >= ?",
+                (submission_id, time.time() - self.ttl),
+            ).fetchone()
+        return row[0] if row else None
+
+    def unseen(self, submission_ids: Iterable[str]) -> list:
+        return [submission_id for submission_id in submission_ids if self.stage(submission_id) is None]
+
+    def forget(self, submission_ids: Iterable[str]) -> None:
+        """Drop the recorded stage, e.g. when a scheduled reply could not be posted."""
+        with self._lock:
+            self.conn.executemany("DELETE FROM seen WHERE submission_id = ?",
+                                  [(submission_id,) for submission_id in submission_ids])
+
+    def mark(self, submission_ids: Iterable[str], stage: str) -> None:
+        now = time.time()
+        rows = [(submission_id, stage, now, now - self.ttl) for submission_id in submission_ids]
+        with self._lock:
+            for row in rows:
+                self.bloom.add(row[0])
+            self.conn.executemany(
+                "INSERT INTO seen (submission_id, stage, seen_at) VALUES (?1, ?2, ?3) "
+                "ON CONFLICT (submission_id) DO UPDATE SET stage = excluded.stage, seen_at = excluded.seen_at "
+                f"WHERE seen.stage = '{EVALUATED}' OR seen.seen_at < ?4",
+                rows,
+            )
@@ -1,9 +1,12 @@
 from crewai.tools import tool
 import time
 
+from tools.instrumentation import instrumented
+
 class UtilityTools:
     @staticmethod
     @tool("Esperar cierta cantidad de tiempo")
+    @instrumented("wait")
     def wait(mins: int) -> str:
         """Esperar cierta cantidad de tiempo"""
         duration_in_seconds = mins * 60
@@ -0,0 +1,50 @@
+import asyncio
+import os
+import time
+
+# Separate limits: the browser is bound by RAM/CPU, the LLM by API rate limits
+DEFAULT_BROWSER_CONCURRENCY = int(os.getenv("YT_BROWSER_CONCURRENCY", "4"))
+DEFAULT_LLM_CONCURRENCY = int(os.getenv("YT_LLM_CONCURRENCY", "8"))
+
+
+def load_channel_urls(path):
+    """Read one channel URL per line, ignoring blank lines and # comments."""
+    with open(path) as f:
+        urls = [line.strip() for line in f]
+    return [url for url in urls if url and not url.startswith("#")]
+
+
+async def run_batch(channel_urls, scrape, analyze, save,
+                    browser_concurrency=DEFAULT_BROWSER_CONCURRENCY,
+                    llm_concurrency=DEFAULT_LLM_CONCURRENCY):
+    """Scrape and analyse many channels with overlapping I/O.
+
+    Every channel runs as its own task, so while one channel waits on Grok the next ones
+    are already being scraped. `scrape(url)` and `analyze(channel_data)` are coroutines;
+    `save(channel_data, analysis)` writes the report and returns its path, and is called
+    as soon as that channel's analysis is ready.
+
+    Returns a list of (channel_url, output_path, error) in input order.
+    """
+    browser_slots = asyncio.Semaphore(browser_concurrency)
+    llm_slots = asyncio.Semaphore(llm_concurrency)
+
+    async def process(channel_url):
+        try:
+            async with browser_slots:
+                channel_data = await scrape(channel_url)
+            async with llm_slots:
+                analysis = await analyze(channel_data)
+            output_path = save(channel_data, analysis)
+            print(f"[ok] {channel_url} -> {output_path}")
+            return channel_url, output_path, None
+        except Exception as e:
+            print(f"[error] {channel_url}: {e}")
+            return channel_url, None, e
+
+    started = time.perf_counter()
+    results = await asyncio.gather(*(process(url) for url in channel_urls))
+    elapsed = time.perf_counter() - started
+    failed = sum(1 for _, _, error in results if error)
+    print(f"\nBatch finished: {len(results) - failed} ok, {failed} failed in {elapsed:.1f}s")
+    return results
@@ -0,0 +1,281 @@
+# python benchmarks/bench_pipeline.py --sizes 1 10 100 --llm-latency 2.0 (benchmark sin YouTube ni api.x.ai)
+# python benchmarks/bench_pipeline.py --extractor dom --json bench.json (tampoco llama a AgentQL)
+# python benchmarks/bench_pipeline.py --extractor selectors (AgentQL solo en la primera página)
+
+import argparse
+import asyncio
+import importlib.util
+import json
+import multiprocessing
+import os
+import resource
+import statistics
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import unquote
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+PROJECT_DIR = os.path.dirname(BENCH_DIR)
+sys.path.insert(0, PROJECT_DIR)
+
+FIXTURE_HTML = os.path.join(BENCH_DIR, "fixtures", "channel.html")
+
+FAKE_REPORT = """# YouTube Channel Analysis Report
+
+## 1. Channel Overview
+Benchmark report generated by the local fake endpoint.
+
+## 2. Top 3 Performing Videos
+- Placeholder content so the report has a realistic size.
+""" * 8
+
+# Header values for --extractor dom; the video grid reuses the harvester's extractor
+_DOM_HEADER_JS = """
+() => {
+    const texts = [...document.querySelectorAll('.yt-content-metadata-view-model-wiz__metadata-text')]
+        .map(span => span.textContent.trim());
+    const name = document.querySelector('#page-header h1');
+    return {
+        channel_name: name ? name.textContent.trim() : null,
+        subscriber_count: texts.find(text => /subscriber/i.test(text)) || null,
+        total_videos: texts.find(text => /video/i.test(text)) || null,
+    };
+}
+"""
+
+
+def _serve(handler_class):
+    server = ThreadingHTTPServer(("127.0.0.1", 0), handler_class)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def start_channel_server(html_dir=None):
+    """Serve recorded channel pages: /@<name>/videos returns a page for channel <name>.
+
+    With --html-dir every recorded *.html file is served round-robin, otherwise the bundled
+    synthetic fixture is used with the channel name filled in.
+    """
+    if html_dir:
+        paths = sorted(os.path.join(html_dir, name) for name in os.listdir(html_dir) if name.endswith(".html"))
+    else:
+        paths = [FIXTURE_HTML]
+    pages = []
+    for path in paths:
+        with open(path, encoding="utf-8") as f:
+            pages.append(f.read())
+
+    class ChannelHandler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            parts = unquote(self.path).strip("/").split("/")
+            if not parts[0].startswith("@"):
+                self.send_error(404)
+                return
+            index = int(parts[0].rsplit("-", 1)[-1]) if parts[0].rsplit("-", 1)[-1].isdigit() else 0
+            body = pages[index % len(pages)].replace("{{channel_name}}", parts[0][1:]).encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", "text/html; charset=utf-8")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    return _serve(ChannelHandler)
+
+
+def start_fake_llm_server(latency, tokens_per_s):
+    """Minimal OpenAI-compatible /chat/completions with fixed latency, streaming included."""
+
+    class CompletionsHandler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_POST(self):
+            request = json.loads(self.rfile.read(int(self.headers.get("Content-Length", 0))))
+            prompt_tokens = sum(len(message["content"]) for message in request["messages"]) // 4
+            words = FAKE_REPORT.split(" ")
+            time.sleep(latency)
+
+            if not request.get("stream"):
+                body = json.dumps({
+                    "id": "chatcmpl-bench",
+                    "object": "chat.completion",
+                    "created": int(time.time()),
+                    "model": request["model"],
+                    "choices": [{"index": 0, "finish_reason": "stop",
+                                 "message": {"role": "assistant", "content": FAKE_REPORT}}],
+                    "usage": {"prompt_tokens": prompt_tokens, "completion_tokens": len(words),
+                              "total_tokens": prompt_tokens + len(words)},
+                }).encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+                return
+
+            self.send_response(200)
+            self.send_header("Content-Type", "text/event-stream")
+            self.send_header("Connection", "close")
+            self.end_headers()
+            self.close_connection = True
+            for i, word in enumerate(words):
+                chunk = {"id": "chatcmpl-bench", "object": "chat.completion.chunk", "created": 0,
+                         "model": request["model"],
+                         "choices": [{"index": 0, "finish_reason": None,
+                                      "delta": {"content": word if i == 0 else " " + word}}]}
+                self.wfile.write(f"data: {json.dumps(chunk)}\n\n".encode("utf-8"))
+                time.sleep(1 / tokens_per_s)
+            usage = {"id": "chatcmpl-bench", "object": "chat.completion.chunk", "created": 0,
+                     "model": request["model"], "choices": [],
+                     "usage": {"prompt_tokens": prompt_tokens, "completion_tokens": len(words),
+                               "total_tokens": prompt_tokens + len(words)}}
+            self.wfile.write(f"data: {json.dumps(usage)}\n\ndata: [DONE]\n\n".encode("utf-8"))
+
+        def log_message(self, *args):
+            pass
+
+    return _serve(CompletionsHandler)
+
+
+def load_agent(llm_base_url):
+    """Import yt-main-agent.py (not a valid module name) with its clients pointed at the fake server."""
+    os.environ["XAI_BASE_URL"] = llm_base_url
+    os.environ.setdefault("XAI_API_KEY", "bench")
+    spec = importlib.util.spec_from_file_location("yt_main_agent", os.path.join(PROJECT_DIR, "yt-main-agent.py"))
+    agent = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(agent)
+    return agent
+
+
+def _peak_rss_mb(who):
+    # ru_maxrss is KiB on Linux and bytes on macOS
+    peak = resource.getrusage(who).ru_maxrss
+    return round(peak / (1024 * 1024 if sys.platform == "darwin" else 1024), 1)
+
+
+async def run_size(agent, channel_base_url, size, args):
+    from browser_pool import BrowserPool
+    from resource_blocker import ResourceBlocker
+    from selector_cache import SelectorCache
+    from video_harvester import _EXTRACT_VIDEOS_JS
+
+    scrape_times, analysis_times = [], []
+    selectors = SelectorCache(args.selector_cache) if args.extractor == "selectors" else None
+
+    async def scrape(channel_url):
+        started = time.perf_counter()
+        if args.extractor == "dom":
+            async with pool.page() as page:
+                await page.goto(channel_url)
+                channel_data = await page.evaluate(_DOM_HEADER_JS)
+                channel_data["recent_videos"] = await page.evaluate(_EXTRACT_VIDEOS_JS, 0)
+        else:
+            channel_data = await agent.get_channel_info(channel_url, pool, selectors=selectors)
+        scrape_times.append(time.perf_counter() - started)
+        return channel_data
+
+    async def analyze(channel_data):
+        started = time.perf_counter()
+        if args.stream:
+            result = await agent.stream_youtube_analysis(channel_data, metrics_path=agent.METRICS_PATH)
+        else:
+            result = await agent.get_youtube_analysis(channel_data)
+        analysis_times.append(time.perf_counter() - started)
+        return result
+
+    save = (lambda channel_data, output_path: output_path) if args.stream else agent.save_analysis
+    channel_urls = [f"{channel_base_url}/@bench-{i}/videos" for i in range(size)]
+    blocker = None if args.no_block_resources else ResourceBlocker.from_env()
+
+    started = time.perf_counter()
+    async with BrowserPool(size=args.browser_concurrency, blocker=blocker) as pool:
+        results = await agent.run_batch(channel_urls, scrape, analyze, save,
+                                        browser_concurrency=args.browser_concurrency,
+                                        llm_concurrency=args.llm_concurrency)
+    elapsed = time.perf_counter() - started
+
+    def summarise(times):
+        if not times:
+            return None
+        ordered = sorted(times)
+        return {"mean_s": round(statistics.mean(times), 3),
+                "p50_s": round(ordered[len(ordered) // 2], 3),
+                "p95_s": round(ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))], 3)}
+
+    return {
+        "channels": size,
+        "failed": sum(1 for _, _, error in results if error),
+        "wall_time_s": round(elapsed, 2),
+        "channels_per_min": round(size / elapsed * 60, 1),
+        "scrape": summarise(scrape_times),
+        "analysis": summarise(analysis_times),
+        # Each size runs in its own process (see measure_size), so this peak belongs to this run
+        "peak_rss_mb": _peak_rss_mb(resource.RUSAGE_SELF),
+        # Largest single child that has exited (e.g. one Chromium process), not Chromium's total
+        "largest_child_rss_mb": _peak_rss_mb(resource.RUSAGE_CHILDREN),
+    }
+
+
+def measure_size(llm_base_url, channel_base_url, output_dir, size, args):
+    """Run one size in the current process; called in a fresh process per size."""
+    agent = load_agent(llm_base_url)
+    # Keep benchmark reports out of youtube_analyses/
+    agent.ANALYSES_DIR = output_dir
+    agent.METRICS_PATH = os.path.join(output_dir, "stream_metrics.jsonl")
+    return asyncio.run(run_size(agent, channel_base_url, size, args))
+
+
+def print_result(result):
+    scrape = result["scrape"] or {}
+    analysis = result["analysis"] or {}
+    print(f"{result['channels']:>5} channels | {result['wall_time_s']:>8.2f}s | "
+          f"{result['channels_per_min']:>8.1f} ch/min | "
+          f"scrape p50 {scrape.get('p50_s')}s p95 {scrape.get('p95_s')}s | "
+          f"analysis p50 {analysis.get('p50_s')}s p95 {analysis.get('p95_s')}s | "
+          f"rss {result['peak_rss_mb']} MB (largest child {result['largest_child_rss_mb']} MB) | "
+          f"failed {result['failed']}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Offline throughput benchmark for the YT Analysis pipeline")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1, 10, 100])
+    parser.add_argument("--llm-latency", type=float, default=1.0, help="seconds before the fake LLM answers")
+    parser.add_argument("--llm-tokens-per-s", type=float, default=200.0, help="streaming speed of the fake LLM")
+    parser.add_argument("--extractor", choices=["agentql", "selectors", "dom"], default="agentql",
+                        help="agentql still calls the AgentQL API; selectors only until it has learned "
+                             "the page layout; dom is fully offline")
+    parser.add_argument("--selector-cache", default=os.path.join(BENCH_DIR, "bench_selector_cache.json"))
+    parser.add_argument("--html-dir", help="directory of recorded channel pages (*.html)")
+    parser.add_argument("--browser-concurrency", type=int, default=4)
+    parser.add_argument("--llm-concurrency", type=int, default=8)
+    parser.add_argument("--stream", action="store_true")
+    parser.add_argument("--no-block-resources", action="store_true")
+    parser.add_argument("--json", metavar="FILE", help="also write the results as JSON")
+    args = parser.parse_args()
+
+    channel_server = start_channel_server(args.html_dir)
+    llm_server = start_fake_llm_server(args.llm_latency, args.llm_tokens_per_s)
+    llm_base_url = f"http://127.0.0.1:{llm_server.server_port}/v1"
+    channel_base_url = f"http://127.0.0.1:{channel_server.server_port}"
+    output_dir = tempfile.mkdtemp(prefix="yt-bench-")
+
+    # ru_maxrss never goes down, so every size gets a fresh process for its peak RSS
+    spawn = multiprocessing.get_context("spawn")
+    results = []
+    for size in args.sizes:
+        with ProcessPoolExecutor(max_workers=1, mp_context=spawn) as executor:
+            result = executor.submit(measure_size, llm_base_url, channel_base_url, output_dir, size, args).result()
+        print_result(result)
+        results.append(result)
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump({"args": vars(args), "results": results}, f, indent=2)
+        print(f"\nResults written to {args.json}")
@@ -0,0 +1,85 @@
+import asyncio
+import os
+from contextlib import asynccontextmanager
+
+import agentql
+from dotenv import load_dotenv
+from playwright.async_api import async_playwright
+
+load_dotenv()
+
+# Pool defaults, overridable from .env
+DEFAULT_POOL_SIZE = int(os.getenv("YT_BROWSER_POOL_SIZE", "2"))
+DEFAULT_HEADLESS = os.getenv("YT_BROWSER_HEADLESS", "true").lower() != "false"
+# Contexts are recycled after this many pages so cookies/cache don't grow forever
+DEFAULT_PAGES_PER_CONTEXT = int(os.getenv("YT_BROWSER_PAGES_PER_CONTEXT", "50"))
+
+
+class BrowserPool:
+    """Keeps one Chromium process alive and lends out pages from a fixed set of contexts.
+
+    `size` contexts means up to `size` pages scraping at once. Chromium is launched lazily
+    on the first borrowed page, so creating a pool is free.
+    """
+
+    def __init__(self, size=DEFAULT_POOL_SIZE, headless=DEFAULT_HEADLESS,
+                 pages_per_context=DEFAULT_PAGES_PER_CONTEXT, blocker=None):
+        self.size = max(1, size)
+        self.headless = headless
+        self.pages_per_context = pages_per_context
+        self.blocker = blocker
+        self._playwright = None
+        self._browser = None
+        self._contexts = None
+        self._lock = asyncio.Lock()
+
+    async def start(self):
+        async with self._lock:
+            if self._browser is None:
+                self._playwright = await async_playwright().start()
+                self._browser = await self._playwright.chromium.launch(headless=self.headless)
+                self._contexts = asyncio.Queue()
+                for _ in range(self.size):
+                    self._contexts.put_nowait([await self._new_context(), 0])
+        return self
+
+    async def _new_context(self):
+        context = await self._browser.new_context()
+        if self.blocker:
+            await self.blocker.attach(context)
+        return context
+
+    @asynccontextmanager
+    async def page(self):
+        """Borrow an AgentQL-wrapped async page; waits while all contexts are busy."""
+        await self.start()
+        slot = await self._contexts.get()
+        page = await slot[0].new_page()
+        try:
+            yield agentql.wrap_async(page)
+        finally:
+            await page.close()
+            slot[1] += 1
+            if slot[1] >= self.pages_per_context:
+                await slot[0].close()
+                slot[:] = [await self._new_context(), 0]
+            self._contexts.put_nowait(slot)
+
+    async def close(self):
+        async with self._lock:
+            if self._browser is None:
+                return
+            while not self._contexts.empty():
+                await self._contexts.get_nowait()[0].close()
+            await self._browser.close()
+            await self._playwright.stop()
+            self._browser = None
+            self._playwright = None
+
+    async def __aenter__(self):
+        # Chromium still starts lazily, so a run served entirely from cache never launches it
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.close()
+
@@ -0,0 +1,150 @@
+import argparse
+import sqlite3
+import time
+
+import numpy as np
+
+from video_harvester import channel_videos
+from video_stats import parse_age_days, parse_count
+
+DEFAULT_DB_PATH = "channel_history.db"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS snapshots (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    channel_url TEXT NOT NULL,
+    channel_name TEXT,
+    scraped_at REAL NOT NULL,
+    subscriber_count REAL,
+    total_videos REAL
+);
+CREATE INDEX IF NOT EXISTS idx_snapshots_channel ON snapshots (channel_url, scraped_at);
+CREATE TABLE IF NOT EXISTS video_snapshots (
+    snapshot_id INTEGER NOT NULL REFERENCES snapshots (id),
+    video_key TEXT NOT NULL,
+    title TEXT,
+    views REAL,
+    age_days REAL
+);
+CREATE INDEX IF NOT EXISTS idx_video_snapshots_snapshot ON video_snapshots (snapshot_id);
+"""
+
+
+class ChannelStore:
+    """Append-only SQLite history of every scraped snapshot, with growth queries on top.
+
+    Rows are never updated: each scrape adds one `snapshots` row plus one `video_snapshots`
+    row per video, and velocities are computed by diffing snapshots with numpy.
+    """
+
+    def __init__(self, path=DEFAULT_DB_PATH):
+        self.conn = sqlite3.connect(path)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.executescript(_SCHEMA)
+
+    def close(self):
+        self.conn.close()
+
+    def record_snapshot(self, channel_url, channel_data, scraped_at=None):
+        scraped_at = scraped_at or time.time()
+        with self.conn:
+            cursor = self.conn.execute(
+                "INSERT INTO snapshots (channel_url, channel_name, scraped_at, subscriber_count, total_videos) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (channel_url, channel_data.get("channel_name"), scraped_at,
+                 _nullable(parse_count(channel_data.get("subscriber_count"))),
+                 _nullable(parse_count(channel_data.get("total_videos")))),
+            )
+            snapshot_id = cursor.lastrowid
+            self.conn.executemany(
+                "INSERT INTO video_snapshots (snapshot_id, video_key, title, views, age_days) VALUES (?, ?, ?, ?, ?)",
+                ((snapshot_id, video.get("url") or video.get("title") or "", video.get("title"),
+                  _nullable(parse_count(video.get("views"))),
+                  _nullable(parse_age_days(video.get("published_date"))[0]))
+                 for video in channel_videos(channel_data)),
+            )
+        return snapshot_id
+
+    def _snapshots(self, channel_url, since=None, until=None):
+        rows = self.conn.execute(
+            "SELECT id, scraped_at, subscriber_count, total_videos FROM snapshots "
+            "WHERE channel_url = ? AND scraped_at >= ? AND scraped_at <= ? ORDER BY scraped_at",
+            (channel_url, since or 0, until or float("inf")),
+        ).fetchall()
+        return np.array(rows, dtype=float).reshape(-1, 4)
+
+    def channel_growth(self, channel_url, since=None, until=None):
+        """Subscriber and upload counts per snapshot, with deltas and per-day rates between them."""
+        snaps = self._snapshots(channel_url, since, until)
+        times, subscribers, videos = snaps[:, 1], snaps[:, 2], snaps[:, 3]
+        elapsed_days = np.diff(times) / 86400
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return {
+                "scraped_at": times,
+                "subscriber_count": subscribers,
+                "total_videos": videos,
+                "subscriber_delta": np.diff(subscribers),
+                "subscribers_per_day": np.diff(subscribers) / elapsed_days,
+                "uploads_delta": np.diff(videos),
+            }
+
+    def _videos(self, snapshot_id):
+        rows = self.conn.execute(
+            "SELECT video_key, title, views FROM video_snapshots WHERE snapshot_id = ?", (int(snapshot_id),)
+        ).fetchall()
+        keys = np.array([row[0] for row in rows], dtype=object)
+        # Keep the first occurrence of each video in case the grid rendered it twice
+        keys, first = np.unique(keys.astype(str), return_index=True)
+        titles = np.array([rows[i][1] for i in first], dtype=object)
+        views = np.array([rows[i][2] for i in first], dtype=float)
+        return keys, titles, views
+
+    def view_velocity(self, channel_url, since=None, until=None):
+        """Views gained per day for every video present in both the first and last snapshot of the window.
+
+        Defaults to the two most recent snapshots. Results are sorted by views/day, fastest first.
+        """
+        snaps = self._snapshots(channel_url, since, until)
+        if len(snaps) < 2:
+            return []
+        if since is None and until is None:
+            snaps = snaps[-2:]
+        old, new = snaps[0], snaps[-1]
+        old_keys, _, old_views = self._videos(old[0])
+        new_keys, new_titles, new_views = self._videos(new[0])
+        _, old_idx, new_idx = np.intersect1d(old_keys, new_keys, assume_unique=True, return_indices=True)
+
+        delta = new_views[new_idx] - old_views[old_idx]
+        per_day = delta / max((new[1] - old[1]) / 86400, 1e-9)
+        order = np.argsort(-np.nan_to_num(per_day, nan=-np.inf), kind="stable")
+        return [{
+            "video_key": str(new_keys[new_idx[i]]),
+            "title": new_titles[new_idx[i]],
+            "views": None if np.isnan(new_views[new_idx[i]]) else int(new_views[new_idx[i]]),
+            "views_delta": None if np.isnan(delta[i]) else int(delta[i]),
+            "views_per_day": None if np.isnan(per_day[i]) else round(float(per_day[i]), 1),
+        } for i in order]
+
+
+def _nullable(value):
+    return None if value is None or np.isnan(value) else float(value)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Query the channel history store")
+    parser.add_argument("channel_url")
+    parser.add_argument("--db", default=DEFAULT_DB_PATH)
+    parser.add_argument("--top", type=int, default=10, help="number of fastest videos to show")
+    args = parser.parse_args()
+
+    store = ChannelStore(args.db)
+    growth = store.channel_growth(args.channel_url)
+    print(f"Snapshots: {len(growth['scraped_at'])}")
+    if len(growth["scraped_at"]) > 1:
+        print(f"Subscribers: {growth['subscriber_count'][0]:.0f} -> {growth['subscriber_count'][-1]:.0f} "
+              f"({np.nansum(growth['subscriber_delta']):+.0f})")
+        print(f"Uploads since first snapshot: {np.nansum(growth['uploads_delta']):+.0f}")
+        print("\nFastest growing videos since the previous snapshot:")
+        for video in store.view_velocity(args.channel_url)[:args.top]:
+            print(f"- {video['views_per_day']} views/day ({video['views_delta']}) | {video['title']}")
+    store.close()
@@ -0,0 +1,156 @@
+import numpy as np
+
+from video_harvester import channel_videos
+from video_stats import parse_age_days, parse_count
+
+DEFAULT_NICHE = "general"
+
+# Metrics ranked against the other channels of the same niche
+_RANKED_METRICS = ("median_views", "uploads_per_week", "views_per_subscriber")
+
+
+def load_channel_niches(path):
+    """Read `channel_url[,niche]` lines; channels without a niche are grouped as "general"."""
+    channels = []
+    with open(path) as f:
+        for line in f:
+            line = line.strip()
+            if not line or line.startswith("#"):
+                continue
+            url, _, niche = line.partition(",")
+            channels.append((url.strip(), niche.strip() or DEFAULT_NICHE))
+    return channels
+
+
+def _group_bounds(group_idx, n_groups):
+    counts = np.bincount(group_idx, minlength=n_groups)
+    starts = np.concatenate(([0], np.cumsum(counts)[:-1]))
+    return counts, starts
+
+
+def _group_median(group_idx, values, n_groups):
+    if not len(values):
+        return np.full(n_groups, np.nan)
+    order = np.lexsort((values, group_idx))
+    sorted_values = values[order]
+    counts, starts = _group_bounds(group_idx, n_groups)
+    # Empty groups point at a valid index and are masked out below
+    lo = np.minimum(starts + (counts - 1) // 2, len(values) - 1)
+    hi = np.minimum(starts + counts // 2, len(values) - 1)
+    return np.where(counts > 0, (sorted_values[lo] + sorted_values[hi]) / 2, np.nan)
+
+
+def _percentile_within(group_idx, values, n_groups):
+    """Percentile rank (0-100] of each value among the values of its group; NaN stays NaN."""
+    result = np.full(len(values), np.nan)
+    valid = ~np.isnan(values)
+    idx = np.flatnonzero(valid)
+    if not len(idx):
+        return result
+    order = idx[np.lexsort((values[idx], group_idx[idx]))]
+    counts, starts = _group_bounds(group_idx[idx], n_groups)
+    rank = np.arange(len(order)) - starts[group_idx[order]]
+    result[order] = 100.0 * (rank + 1) / counts[group_idx[order]]
+    return result
+
+
+def build_channel_table(channels):
+    """Column-oriented table with one row per channel, computed from flattened video arrays.
+
+    `channels` is a list of (channel_data, niche). Every video of every channel goes into
+    shared arrays tagged with its channel index, so all per-channel aggregates are single
+    numpy group operations instead of Python loops over channels.
+    """
+    names, niches, subscribers, total_videos = [], [], [], []
+    video_channel, video_views, video_ages = [], [], []
+    for i, (channel_data, niche) in enumerate(channels):
+        names.append(channel_data.get("channel_name") or f"channel {i}")
+        niches.append(niche)
+        subscribers.append(parse_count(channel_data.get("subscriber_count")))
+        total_videos.append(parse_count(channel_data.get("total_videos")))
+        for video in channel_videos(channel_data):
+            video_channel.append(i)
+            video_views.append(parse_count(video.get("views")))
+            video_ages.append(parse_age_days(video.get("published_date"))[0])
+
+    n = len(names)
+    video_channel = np.asarray(video_channel, dtype=np.int64)
+    video_views = np.asarray(video_views, dtype=float)
+    video_ages = np.asarray(video_ages, dtype=float)
+    subscribers = np.asarray(subscribers, dtype=float)
+
+    has_views = ~np.isnan(video_views)
+    view_channel, views = video_channel[has_views], video_views[has_views]
+    counts = np.bincount(view_channel, minlength=n)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        mean_views = np.bincount(view_channel, weights=views, minlength=n) / counts
+    median_views = _group_median(view_channel, views, n)
+
+    # Upload frequency from the span between each channel's newest and oldest dated video
+    has_age = ~np.isnan(video_ages)
+    age_channel, ages = video_channel[has_age], video_ages[has_age]
+    dated = np.bincount(age_channel, minlength=n)
+    newest = np.full(n, np.inf)
+    oldest = np.full(n, -np.inf)
+    np.minimum.at(newest, age_channel, ages)
+    np.maximum.at(oldest, age_channel, ages)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        uploads_per_week = np.where(dated > 1, (dated - 1) / np.maximum(oldest - newest, 1.0) * 7, np.nan)
+        # No likes/comments are scraped, so views per subscriber is our engagement proxy
+        views_per_subscriber = np.where(subscribers > 0, median_views / subscribers, np.nan)
+
+    niche_names, niche_idx = np.unique(np.asarray(niches, dtype=str), return_inverse=True)
+    table = {
+        "channel_name": np.asarray(names, dtype=object),
+        "niche": np.asarray(niches, dtype=object),
+        "niche_idx": niche_idx,
+        "niche_names": niche_names,
+        "subscribers": subscribers,
+        "total_videos": np.asarray(total_videos, dtype=float),
+        "videos_analysed": counts,
+        "mean_views": mean_views,
+        "median_views": median_views,
+        "uploads_per_week": uploads_per_week,
+        "views_per_subscriber": views_per_subscriber,
+    }
+    for metric in _RANKED_METRICS:
+        table[f"{metric}_pct"] = _percentile_within(niche_idx, table[metric], len(niche_names))
+    return table
+
+
+def niche_benchmarks(table):
+    """Median of each ranked metric per niche."""
+    n_niches = len(table["niche_names"])
+    benchmarks = {"channels": np.bincount(table["niche_idx"], minlength=n_niches)}
+    for metric in _RANKED_METRICS:
+        values = table[metric]
+        valid = ~np.isnan(values)
+        benchmarks[metric] = _group_median(table["niche_idx"][valid], values[valid], n_niches)
+    return benchmarks
+
+
+def _fmt(value, digits=0):
+    if value is None or np.isnan(value):
+        return "?"
+    return f"{value:.{digits}f}"
+
+
+def format_comparison(table, benchmarks):
+    """Compact text for the single comparative prompt: niche benchmarks, then one row per channel."""
+    lines = ["Niche benchmarks (niche|channels|median views/video|median uploads/week|median views/subscriber):"]
+    for i, niche in enumerate(table["niche_names"]):
+        lines.append(f"{niche}|{benchmarks['channels'][i]}|{_fmt(benchmarks['median_views'][i])}|"
+                     f"{_fmt(benchmarks['uploads_per_week'][i], 2)}|{_fmt(benchmarks['views_per_subscriber'][i], 4)}")
+    lines.append("")
+    lines.append("Channels (channel|niche|subscribers|videos analysed|median views (niche pct)|"
+                 "mean views|uploads/week (niche pct)|views/subscriber (niche pct)):")
+    order = np.lexsort((-np.nan_to_num(table["median_views"], nan=-1.0), table["niche_idx"]))
+    for i in order:
+        lines.append(
+            f"{table['channel_name'][i]}|{table['niche'][i]}|{_fmt(table['subscribers'][i])}|"
+            f"{table['videos_analysed'][i]}|{_fmt(table['median_views'][i])} (p{_fmt(table['median_views_pct'][i])})|"
+            f"{_fmt(table['mean_views'][i])}|{_fmt(table['uploads_per_week'][i], 2)} "
+            f"(p{_fmt(table['uploads_per_week_pct'][i])})|{_fmt(table['views_per_subscriber'][i], 4)} "
+            f"(p{_fmt(table['views_per_subscriber_pct'][i])})"
+        )
+    return "\n".join(lines)
@@ -0,0 +1,66 @@
+import math
+import os
+
+import numpy as np
+from dotenv import load_dotenv
+
+from video_stats import parse_count
+
+load_dotenv()
+
+# Max prompt tokens spent on the per-video table
+DEFAULT_TOKEN_BUDGET = int(os.getenv("YT_PROMPT_TOKEN_BUDGET", "3000"))
+
+try:
+    import tiktoken
+    _encoding = tiktoken.get_encoding("cl100k_base")
+except ImportError:
+    _encoding = None
+
+
+def estimate_tokens(text):
+    """Token count via tiktoken when installed, otherwise the usual ~4 chars/token rule."""
+    if _encoding is not None:
+        return len(_encoding.encode(text))
+    return math.ceil(len(text) / 4)
+
+
+def _row(video, views):
+    title = (video.get("title") or "").replace("|", "/").replace("\n", " ").strip()
+    views = "?" if np.isnan(views) else str(int(views))
+    return f"{views}|{video.get('published_date') or '?'}|{title}"
+
+
+def format_video_table(videos, token_budget=DEFAULT_TOKEN_BUDGET):
+    """Serialise videos as `views|published|title` rows, most viewed first, within a token budget.
+
+    When the channel doesn't fit, rows are sampled evenly across the view ranking (always
+    keeping the first and last rows) so the model still sees the whole distribution.
+    Returns (table_text, rows_kept, rows_total).
+    """
+    # Single pass keeping only the rendered rows, so harvested histories are never fully loaded
+    views, rows = [], []
+    for video in videos:
+        views.append(parse_count(video.get("views")))
+        rows.append(_row(video, views[-1]))
+    order = np.argsort(-np.nan_to_num(np.asarray(views, dtype=float), nan=-1.0), kind="stable")
+    rows = [rows[i] for i in order]
+    header = "views|published|title"
+    if not rows:
+        return header, 0, 0
+
+    row_tokens = np.array([estimate_tokens(row) + 1 for row in rows])
+    budget = token_budget - estimate_tokens(header) - 20
+    if row_tokens.sum() <= budget:
+        kept = np.arange(len(rows))
+    else:
+        fit = max(2, int(budget / max(row_tokens.mean(), 1)))
+        kept = np.unique(np.linspace(0, len(rows) - 1, min(fit, len(rows))).round().astype(int))
+        # The mean is only an estimate: drop evenly spaced middle rows until it really fits
+        while len(kept) > 2 and row_tokens[kept].sum() > budget:
+            kept = np.delete(kept, len(kept) // 2)
+
+    lines = [header] + [rows[i] for i in kept]
+    if len(kept) < len(rows):
+        lines.append(f"(sampled {len(kept)} of {len(rows)} videos evenly across the view ranking)")
+    return "\n".join(lines), len(kept), len(rows)
@@ -0,0 +1,104 @@
+import os
+import re
+from collections import Counter
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+# AgentQL reads the DOM/accessibility tree, so none of these are needed to extract data
+DEFAULT_BLOCKED_TYPES = ("image", "media", "font")
+DEFAULT_BLOCKED_PATTERNS = (
+    r"googlevideo\.com",          # hover previews and video streams
+    r"doubleclick\.net",
+    r"googlesyndication\.com",
+    r"googleadservices\.com",
+    r"/pagead/",
+    r"/api/stats/",
+    r"/youtubei/v1/log_event",
+    r"/ptracking",
+)
+# Typical transfer sizes, used to estimate what blocked requests would have cost
+_TYPICAL_BYTES = {
+    "image": 40_000,
+    "media": 500_000,
+    "font": 60_000,
+    "stylesheet": 30_000,
+    "script": 100_000,
+    "xhr": 5_000,
+    "fetch": 5_000,
+}
+_DEFAULT_TYPICAL_BYTES = 10_000
+
+
+def _env_list(name, default):
+    value = os.getenv(name)
+    if value is None:
+        return list(default)
+    return [item.strip() for item in value.split(",") if item.strip()]
+
+
+class ResourceBlocker:
+    """Aborts requests by resource type or URL pattern and counts what was saved.
+
+    Attach it to browser contexts via BrowserPool. Note that Playwright
+    disables the HTTP cache for routed requests, which blocking more than makes up for.
+    """
+
+    def __init__(self, blocked_types=DEFAULT_BLOCKED_TYPES, blocked_patterns=DEFAULT_BLOCKED_PATTERNS):
+        self.blocked_types = set(blocked_types)
+        self.blocked_re = re.compile("|".join(blocked_patterns)) if blocked_patterns else None
+        self.blocked = Counter()
+        self.allowed = Counter()
+        self.allowed_bytes = 0
+
+    @classmethod
+    def from_env(cls):
+        """Blocker configured from YT_BLOCK_* variables, or None when YT_BLOCK_RESOURCES=false."""
+        if os.getenv("YT_BLOCK_RESOURCES", "true").lower() == "false":
+            return None
+        return cls(
+            blocked_types=_env_list("YT_BLOCK_RESOURCE_TYPES", DEFAULT_BLOCKED_TYPES),
+            blocked_patterns=_env_list("YT_BLOCK_URL_PATTERNS", DEFAULT_BLOCKED_PATTERNS),
+        )
+
+    def should_block(self, resource_type, url):
+        return resource_type in self.blocked_types or bool(self.blocked_re and self.blocked_re.search(url))
+
+    def _on_response(self, response):
+        length = response.headers.get("content-length")
+        if length and length.isdigit():
+            self.allowed_bytes += int(length)
+
+    async def attach(self, context):
+        async def handle(route):
+            request = route.request
+            if self.should_block(request.resource_type, request.url):
+                self.blocked[request.resource_type] += 1
+                await route.abort()
+            else:
+                self.allowed[request.resource_type] += 1
+                await route.continue_()
+
+        await context.route("**/*", handle)
+        context.on("response", self._on_response)
+
+    def report(self):
+        estimated_saved = sum(count * _TYPICAL_BYTES.get(kind, _DEFAULT_TYPICAL_BYTES)
+                              for kind, count in self.blocked.items())
+        return {
+            "requests_blocked": sum(self.blocked.values()),
+            "requests_allowed": sum(self.allowed.values()),
+            "blocked_by_type": dict(self.blocked),
+            "estimated_bytes_saved": estimated_saved,
+            "bytes_loaded": self.allowed_bytes,
+        }
+
+    def print_report(self):
+        report = self.report()
+        print(f"\n[blocker] {report['requests_blocked']} requests blocked "
+              f"(~{report['estimated_bytes_saved'] / 1e6:.1f} MB saved), "
+              f"{report['requests_allowed']} allowed ({report['bytes_loaded'] / 1e6:.1f} MB loaded)")
+        if report["blocked_by_type"]:
+            print("[blocker] by type: " + ", ".join(f"{kind} {count}"
+                                                  for kind, count in report["blocked_by_type"].items()))
@@ -0,0 +1,244 @@
+import hashlib
+import json
+import os
+import re
+import time
+from urllib.parse import urlparse
+
+DEFAULT_SELECTOR_CACHE_PATH = os.getenv("YT_SELECTOR_CACHE", "selector_cache.json")
+# How long the fast path waits for the list to render before declaring the selectors stale
+RENDER_TIMEOUT_MS = 5000
+# Fraction of list items that must have every field for the selectors to be trusted
+MIN_COMPLETE_ITEMS = 0.9
+
+# Structural path of an element from <body> down: tag plus id when the id isn't generated
+_ELEMENT_PATH_JS = """
+(el) => {
+    const segments = [];
+    for (let node = el; node && node.nodeType === 1 && node !== document.documentElement; node = node.parentElement) {
+        let segment = node.localName;
+        if (node.id && !/\\d/.test(node.id)) segment += '#' + CSS.escape(node.id);
+        segments.unshift(segment);
+    }
+    return segments;
+}
+"""
+
+# Position of `el` among the matches of `selector`, searched from `depth` ancestors up (0 = document)
+_ELEMENT_INDEX_JS = """
+([el, depth, selector]) => {
+    let root = document;
+    if (depth > 0) {
+        root = el;
+        for (let i = 0; i < depth; i++) root = root.parentElement;
+    }
+    const matches = selector ? [...root.querySelectorAll(selector)] : [root];
+    return matches.indexOf(el);
+}
+"""
+
+# Applies a learned spec in a single round trip
+_EXTRACT_JS = """
+(spec) => {
+    const text = (el) => el ? (el.innerText || el.textContent || '').trim() : null;
+    const data = {};
+    for (const [name, field] of Object.entries(spec.fields)) {
+        data[name] = text(document.querySelectorAll(field.selector)[field.index]);
+    }
+    for (const [name, list] of Object.entries(spec.lists)) {
+        data[name] = [...document.querySelectorAll(list.item)].map(item => {
+            const row = {};
+            for (const [field, rel] of Object.entries(list.fields)) {
+                const matches = rel.selector ? item.querySelectorAll(':scope > ' + rel.selector) : [item];
+                row[field] = text(matches[rel.index]);
+            }
+            return row;
+        });
+    }
+    return data;
+}
+"""
+
+_WAIT_FOR_ITEMS_JS = "(selector) => document.querySelectorAll(selector).length > 0"
+
+
+def parse_query_shape(query):
+    """Split a flat AgentQL query into top-level scalar fields and `name[] { fields }` lists."""
+    tokens = re.findall(r"\w+\[\]|\w+|[{}]", query)
+    scalars, lists = [], {}
+    depth, current_list = 0, None
+    for i, token in enumerate(tokens):
+        if token == "{":
+            depth += 1
+        elif token == "}":
+            depth -= 1
+            if depth == 1:
+                current_list = None
+        elif depth == 1:
+            if i + 1 < len(tokens) and tokens[i + 1] == "{":
+                current_list = token.rstrip("[]")
+                lists[current_list] = []
+            else:
+                scalars.append(token)
+        elif depth == 2 and current_list:
+            lists[current_list].append(token)
+    return scalars, lists
+
+
+def page_key(url):
+    """Pages sharing a layout share selectors: channel handles and ids are wildcarded."""
+    parsed = urlparse(url)
+    path = re.sub(r"^/(@[^/]+|channel/[^/]+|c/[^/]+|user/[^/]+)", "/*", parsed.path.rstrip("/"))
+    return f"{parsed.netloc}{path or '/'}"
+
+
+def _common_prefix(paths):
+    prefix = []
+    for segments in zip(*paths):
+        if len(set(segments)) != 1:
+            break
+        prefix.append(segments[0])
+    return prefix
+
+
+def validate(data, query):
+    """Selectors are trusted only when every scalar and nearly every list row came back filled."""
+    scalars, lists = parse_query_shape(query)
+    if not data or any(not data.get(name) for name in scalars):
+        return False
+    for name, fields in lists.items():
+        rows = data.get(name) or []
+        if not rows:
+            return False
+        complete = sum(1 for row in rows if all(row.get(field) for field in fields))
+        if complete < MIN_COMPLETE_ITEMS * len(rows):
+            return False
+    return True
+
+
+class SelectorCache:
+    """Concrete CSS selectors learned from AgentQL, persisted per site/page layout.
+
+    The first page of a layout is resolved with `query_elements`; the elements' DOM paths
+    become plain selectors that later pages apply with one `evaluate` call. Whenever the
+    extracted data fails validation the entry is dropped and AgentQL is used again.
+    """
+
+    def __init__(self, path=DEFAULT_SELECTOR_CACHE_PATH):
+        self.path = path
+        self.hits = 0
+        self.misses = 0
+        try:
+            with open(path) as f:
+                self.entries = json.load(f)
+        except (OSError, ValueError):
+            self.entries = {}
+
+    def _key(self, url, query):
+        query_hash = hashlib.sha256(" ".join(query.split()).encode("utf-8")).hexdigest()[:12]
+        return f"{page_key(url)}|{query_hash}"
+
+    def get(self, url, query):
+        return self.entries.get(self._key(url, query))
+
+    def put(self, url, query, spec):
+        self.entries[self._key(url, query)] = spec
+        self._save()
+
+    def invalidate(self, url, query):
+        if self.entries.pop(self._key(url, query), None) is not None:
+            self._save()
+
+    def _save(self):
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(self.entries, f, indent=2)
+        os.replace(tmp_path, self.path)
+
+
+def _build_spec(scalar_paths, list_paths):
+    """Turn element paths into a selector spec.
+
+    scalar_paths: {name: (segments, index_in_document)}
+    list_paths: {name: {field: segments}} for the first item of each list
+    """
+    spec = {"fields": {}, "lists": {}, "learned_at": time.time()}
+    for name, (segments, index) in scalar_paths.items():
+        spec["fields"][name] = {"selector": " > ".join(segments), "index": index}
+    for name, field_paths in list_paths.items():
+        # The item root is the deepest ancestor shared by all fields of one item
+        item_prefix = _common_prefix(list(field_paths.values()))
+        spec["lists"][name] = {
+            "item": " > ".join(item_prefix),
+            "fields": {field: {"selector": " > ".join(segments[len(item_prefix):]), "index": 0}
+                       for field, segments in field_paths.items()},
+        }
+    return spec
+
+
+def _all_selectors(spec):
+    yield from (field["selector"] for field in spec["fields"].values())
+    for list_spec in spec["lists"].values():
+        yield list_spec["item"]
+        yield from (field["selector"] for field in list_spec["fields"].values() if field["selector"])
+
+
+async def learn(page, query):
+    """Resolve `query` once with AgentQL and derive concrete selectors from the matched elements."""
+    scalars, lists = parse_query_shape(query)
+    response = await page.query_elements(query)
+
+    scalar_paths = {}
+    for name in scalars:
+        handle = await getattr(response, name).element_handle()
+        segments = await page.evaluate(_ELEMENT_PATH_JS, handle)
+        index = await page.evaluate(_ELEMENT_INDEX_JS, [handle, 0, " > ".join(segments)])
+        scalar_paths[name] = (segments, index)
+
+    list_paths, list_handles = {}, {}
+    for name, fields in lists.items():
+        first_item = getattr(response, name)[0]
+        list_handles[name] = {field: await getattr(first_item, field).element_handle() for field in fields}
+        list_paths[name] = {field: await page.evaluate(_ELEMENT_PATH_JS, handle)
+                            for field, handle in list_handles[name].items()}
+
+    spec = _build_spec(scalar_paths, list_paths)
+    # Fields sharing a selector inside an item (e.g. views and date spans) are told apart by index
+    for name, handles in list_handles.items():
+        item_depth = len(spec["lists"][name]["item"].split(" > "))
+        for field, handle in handles.items():
+            rel = spec["lists"][name]["fields"][field]
+            if rel["selector"]:
+                depth = len(list_paths[name][field]) - item_depth
+                rel["index"] = await page.evaluate(_ELEMENT_INDEX_JS, [handle, depth, ":scope > " + rel["selector"]])
+    return spec
+
+
+def _wait_selector(spec):
+    return next(iter(spec["lists"].values()))["item"] if spec["lists"] else next(_all_selectors(spec))
+
+
+async def query_data_fast(page, query, cache):
+    """Drop-in for `await page.query_data(query)` that uses cached selectors when they still validate."""
+    spec = cache.get(page.url, query)
+    if spec:
+        try:
+            await page.wait_for_function(_WAIT_FOR_ITEMS_JS, arg=_wait_selector(spec), timeout=RENDER_TIMEOUT_MS)
+            data = await page.evaluate(_EXTRACT_JS, spec)
+            if validate(data, query):
+                cache.hits += 1
+                return data
+        except Exception as e:
+            print(f"[selectors] fast path failed on {page.url}: {e}")
+        cache.invalidate(page.url, query)
+
+    cache.misses += 1
+    try:
+        spec = await learn(page, query)
+        data = await page.evaluate(_EXTRACT_JS, spec)
+        if validate(data, query):
+            cache.put(page.url, query, spec)
+            return data
+    except Exception as e:
+        print(f"[selectors] could not learn selectors for {page.url}: {e}")
+    return await page.query_data(query)
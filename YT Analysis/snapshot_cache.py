@@ -0,0 +1,87 @@
+import hashlib
+import json
+import os
+import time
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+DEFAULT_CACHE_DIR = os.getenv("YT_CACHE_DIR", "channel_cache")
+DEFAULT_TTL_SECONDS = float(os.getenv("YT_CACHE_TTL_HOURS", "24")) * 3600
+
+
+def content_hash(channel_data):
+    """Stable hash of the scraped data, independent of dict ordering.
+
+    Harvested channels keep their videos in a JSONL file, so its bytes are hashed too.
+    """
+    payload = json.dumps(channel_data, sort_keys=True, ensure_ascii=False, default=str)
+    digest = hashlib.sha256(payload.encode("utf-8"))
+    videos_path = channel_data.get("videos_path")
+    if videos_path and os.path.exists(videos_path):
+        with open(videos_path, "rb") as f:
+            for block in iter(lambda: f.read(1 << 20), b""):
+                digest.update(block)
+    return digest.hexdigest()
+
+
+class SnapshotCache:
+    """On-disk cache of AgentQL results per channel URL plus reports per content hash.
+
+    Snapshots expire after `ttl_seconds`; reports never expire because they are keyed by
+    the data they were generated from, so an unchanged re-scrape still hits.
+    """
+
+    def __init__(self, cache_dir=DEFAULT_CACHE_DIR, ttl_seconds=DEFAULT_TTL_SECONDS):
+        self.cache_dir = cache_dir
+        self.ttl_seconds = ttl_seconds
+        os.makedirs(os.path.join(cache_dir, "snapshots"), exist_ok=True)
+        os.makedirs(os.path.join(cache_dir, "reports"), exist_ok=True)
+
+    def _snapshot_path(self, channel_url):
+        key = hashlib.sha256(channel_url.encode("utf-8")).hexdigest()[:24]
+        return os.path.join(self.cache_dir, "snapshots", f"{key}.json")
+
+    def _report_path(self, data_hash):
+        return os.path.join(self.cache_dir, "reports", f"{data_hash}.md")
+
+    def get(self, channel_url):
+        """Return the cached channel data, or None if missing or older than the TTL."""
+        path = self._snapshot_path(channel_url)
+        try:
+            with open(path) as f:
+                snapshot = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if time.time() - snapshot["scraped_at"] > self.ttl_seconds:
+            return None
+        return snapshot["data"]
+
+    def put(self, channel_url, channel_data):
+        snapshot = {
+            "channel_url": channel_url,
+            "scraped_at": time.time(),
+            "content_hash": content_hash(channel_data),
+            "data": channel_data,
+        }
+        _write_atomic(self._snapshot_path(channel_url), json.dumps(snapshot, ensure_ascii=False))
+
+    def get_report(self, channel_data):
+        """Return the report previously generated from identical data, if any."""
+        try:
+            with open(self._report_path(content_hash(channel_data))) as f:
+                return f.read()
+        except OSError:
+            return None
+
+    def put_report(self, channel_data, report):
+        _write_atomic(self._report_path(content_hash(channel_data)), report)
+
+
+def _write_atomic(path, text):
+    # Write then rename so concurrent batch tasks never read a half-written file
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, "w") as f:
+        f.write(text)
+    os.replace(tmp_path, path)
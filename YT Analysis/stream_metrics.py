@@ -0,0 +1,46 @@
+import json
+import os
+import time
+from datetime import datetime, timezone
+
+
+class StreamTimer:
+    """Tracks time-to-first-token and throughput of one streamed completion."""
+
+    def __init__(self, channel_name):
+        self.channel_name = channel_name
+        self.started = time.perf_counter()
+        self.first_token_at = None
+        self.chunks = 0
+        self.estimated_tokens = 0
+
+    def chunk(self, tokens):
+        if self.first_token_at is None:
+            self.first_token_at = time.perf_counter()
+        self.chunks += 1
+        self.estimated_tokens += tokens
+
+    def finish(self, completion_tokens=None):
+        """Build the metrics record; prefers the API's usage count over our estimate."""
+        total = time.perf_counter() - self.started
+        tokens = completion_tokens if completion_tokens is not None else self.estimated_tokens
+        ttft = None if self.first_token_at is None else self.first_token_at - self.started
+        generation = total - (ttft or 0.0)
+        return {
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "channel_name": self.channel_name,
+            "time_to_first_token_s": None if ttft is None else round(ttft, 3),
+            "total_time_s": round(total, 3),
+            "completion_tokens": tokens,
+            "tokens_per_s": round(tokens / generation, 1) if generation > 0 else None,
+            "chunks": self.chunks,
+        }
+
+
+def append_metrics(path, record):
+    """Append one JSON line per channel so batch runs can be analysed afterwards."""
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    with open(path, "a") as f:
+        f.write(json.dumps(record, ensure_ascii=False) + "\n")
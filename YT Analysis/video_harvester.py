@@ -0,0 +1,100 @@
+import json
+import os
+import re
+
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
+
+DEFAULT_HISTORY_DIR = "video_history"
+SCROLL_TIMEOUT_MS = 8000
+# Consecutive scrolls without new tiles before we assume the end of the list
+MAX_IDLE_SCROLLS = 3
+
+# AgentQL is only used once per channel for the header; the video grid is read from the DOM
+CHANNEL_HEADER_QUERY = """
+{
+    channel_name
+    subscriber_count
+    total_videos
+}
+"""
+
+# Returns the tiles rendered after index `start`, so each scroll only serialises new videos
+_EXTRACT_VIDEOS_JS = """
+(start) => {
+    const items = document.querySelectorAll('ytd-rich-item-renderer, ytd-grid-video-renderer');
+    const videos = [];
+    for (let i = start; i < items.length; i++) {
+        const item = items[i];
+        const title = item.querySelector('#video-title');
+        const link = item.querySelector('a#video-title-link, a#thumbnail');
+        let meta = [...item.querySelectorAll('#metadata-line span.inline-metadata-item')];
+        if (!meta.length) meta = [...item.querySelectorAll('#metadata-line span')];
+        const texts = meta.map(span => span.textContent.trim()).filter(Boolean);
+        videos.push({
+            title: title ? title.textContent.trim() : '',
+            url: link ? link.href : null,
+            views: texts[0] || null,
+            published_date: texts[1] || null,
+        });
+    }
+    return videos;
+}
+"""
+_COUNT_VIDEOS_JS = "() => document.querySelectorAll('ytd-rich-item-renderer, ytd-grid-video-renderer').length"
+_WAIT_FOR_MORE_JS = ("(seen) => document.querySelectorAll("
+                     "'ytd-rich-item-renderer, ytd-grid-video-renderer').length > seen")
+_SCROLL_JS = "() => window.scrollTo(0, document.documentElement.scrollHeight)"
+
+
+def videos_tab_url(channel_url):
+    """https://www.youtube.com/@Channel[/anything] -> https://www.youtube.com/@Channel/videos"""
+    base = re.sub(r"/(videos|shorts|streams|featured|playlists|community)/?$", "", channel_url.rstrip("/"))
+    return f"{base}/videos"
+
+
+def history_path(channel_name, history_dir=DEFAULT_HISTORY_DIR):
+    os.makedirs(history_dir, exist_ok=True)
+    safe_name = re.sub(r"[^\w\- ]", "_", channel_name or "unknown").strip()
+    return os.path.join(history_dir, f"{safe_name}.jsonl")
+
+
+def iter_videos(path):
+    """Yield video records from a harvested JSONL file one at a time."""
+    with open(path) as f:
+        for line in f:
+            if line.strip():
+                yield json.loads(line)
+
+
+def channel_videos(channel_data):
+    """Videos of a channel, read lazily from disk for harvested channels."""
+    if channel_data.get("videos_path"):
+        return iter_videos(channel_data["videos_path"])
+    return channel_data.get("recent_videos") or []
+
+
+async def harvest_videos(page, output_path, max_videos=None):
+    """Scroll the /videos grid to the end, appending each new batch of tiles to `output_path`.
+
+    Only the current batch is held in memory, so this works for channels with thousands
+    of uploads. Returns the number of videos written.
+    """
+    seen = 0
+    idle_scrolls = 0
+    with open(output_path, "w") as f:
+        while idle_scrolls < MAX_IDLE_SCROLLS and (max_videos is None or seen < max_videos):
+            batch = await page.evaluate(_EXTRACT_VIDEOS_JS, seen)
+            if max_videos is not None:
+                batch = batch[:max_videos - seen]
+            for video in batch:
+                f.write(json.dumps(video, ensure_ascii=False) + "\n")
+            f.flush()
+            seen += len(batch)
+
+            await page.evaluate(_SCROLL_JS)
+            try:
+                await page.wait_for_function(_WAIT_FOR_MORE_JS, arg=seen, timeout=SCROLL_TIMEOUT_MS)
+                idle_scrolls = 0
+            except PlaywrightTimeoutError:
+                idle_scrolls = idle_scrolls + 1 if await page.evaluate(_COUNT_VIDEOS_JS) <= seen else 0
+    return seen
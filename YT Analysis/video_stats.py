@@ -0,0 +1,177 @@
+import re
+from datetime import datetime
+
+import numpy as np
+
+# "1.2M views", "40K views", "1,720,803 views", "2,89 M de suscriptores", "No views"
+_COUNT_RE = re.compile(r"(\d+(?:[.,]\d+)*)\s*(mill\w*|mil|[KMB])?\b", re.IGNORECASE)
+_MULTIPLIERS = {"k": 1e3, "mil": 1e3, "m": 1e6, "mill": 1e6, "b": 1e9}
+
+# "3 weeks ago", "Streamed 2 days ago", "hace 3 semanas"
+_RELATIVE_RE = re.compile(r"(\d+)\s*(second|minute|hour|day|week|month|year|segundo|minuto|hora|"
+                          r"día|dia|semana|mes|año|ano)", re.IGNORECASE)
+_UNIT_DAYS = {
+    "second": 1 / 86400, "segundo": 1 / 86400,
+    "minute": 1 / 1440, "minuto": 1 / 1440,
+    "hour": 1 / 24, "hora": 1 / 24,
+    "day": 1, "día": 1, "dia": 1,
+    "week": 7, "semana": 7,
+    "month": 30.44, "mes": 30.44,
+    "year": 365.25, "año": 365.25, "ano": 365.25,
+}
+_ABSOLUTE_FORMATS = ("%b %d, %Y", "%B %d, %Y", "%d %b %Y", "%Y-%m-%d")
+WEEKDAYS = ("Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun")
+
+
+def parse_count(text):
+    """Turn YouTube's abbreviated counts into a number; NaN when there is nothing to parse."""
+    if text is None:
+        return np.nan
+    if isinstance(text, (int, float)):
+        return float(text)
+    match = _COUNT_RE.search(str(text))
+    if not match:
+        return 0.0 if re.search(r"\bno\b|\bsin\b", str(text), re.IGNORECASE) else np.nan
+    number, suffix = match.groups()
+    if suffix:
+        # Abbreviated counts use a single decimal separator: "1.2M" or "2,89 M"
+        value = float(number.replace(",", "."))
+        suffix = suffix.lower()
+        return value * _MULTIPLIERS["mill" if suffix.startswith("mill") else suffix]
+    # Full counts only use thousands separators: "1,720,803" or "1.720.803"
+    return float(re.sub(r"[.,]", "", number))
+
+
+def parse_age_days(text, now=None):
+    """Age in days of a relative ("3 weeks ago") or absolute ("Jan 5, 2024") date.
+
+    Returns (age_days, exact_day) where exact_day says whether the weekday can be trusted:
+    "3 weeks ago" only locates the upload to within a week.
+    """
+    if not text:
+        return np.nan, False
+    match = _RELATIVE_RE.search(text)
+    if match:
+        amount, unit = int(match.group(1)), match.group(2).lower()
+        unit_days = _UNIT_DAYS[unit]
+        return amount * unit_days, unit_days <= 1
+    now = now or datetime.now()
+    cleaned = re.sub(r"^(Streamed|Premiered)\s+", "", text.strip())
+    for fmt in _ABSOLUTE_FORMATS:
+        try:
+            return (now - datetime.strptime(cleaned, fmt)).total_seconds() / 86400, True
+        except ValueError:
+            continue
+    return np.nan, False
+
+
+def compute_video_stats(videos, now=None, top_n=3):
+    """Compute the numeric parts of the report locally from an iterable of video dicts."""
+    now = now or datetime.now()
+    titles, views, ages, exact = [], [], [], []
+    for video in videos:
+        titles.append(video.get("title") or "")
+        views.append(parse_count(video.get("views")))
+        age, is_exact = parse_age_days(video.get("published_date"), now)
+        ages.append(age)
+        exact.append(is_exact)
+
+    views = np.asarray(views, dtype=float)
+    ages = np.asarray(ages, dtype=float)
+    exact = np.asarray(exact, dtype=bool)
+    stats = {"video_count": len(titles)}
+    if not len(titles):
+        return stats
+
+    valid = ~np.isnan(views)
+    if valid.any():
+        order = np.argsort(-np.where(valid, views, -np.inf), kind="stable")
+        ranked = order[:valid.sum()]
+        percentiles = np.percentile(views[valid], [10, 25, 50, 75, 90])
+        # Percentile rank of every video within the channel
+        pct_rank = np.empty(len(views))
+        pct_rank[ranked] = 100.0 * (1 - np.arange(len(ranked)) / len(ranked))
+
+        def describe(indices):
+            return [{
+                "title": titles[i],
+                "views": int(views[i]),
+                "percentile": round(float(pct_rank[i]), 1),
+                "age_days": None if np.isnan(ages[i]) else round(float(ages[i]), 1),
+            } for i in indices]
+
+        stats["views"] = {
+            "total": int(views[valid].sum()),
+            "mean": int(views[valid].mean()),
+            "p10": int(percentiles[0]),
+            "p25": int(percentiles[1]),
+            "median": int(percentiles[2]),
+            "p75": int(percentiles[3]),
+            "p90": int(percentiles[4]),
+        }
+        stats["top_videos"] = describe(ranked[:top_n])
+        stats["bottom_videos"] = describe(ranked[::-1][:top_n])
+
+        # Views per day since upload corrects for older videos having had more time
+        dated = valid & ~np.isnan(ages)
+        if dated.any():
+            velocity = np.full(len(views), -np.inf)
+            velocity[dated] = views[dated] / np.maximum(ages[dated], 1.0)
+            fastest = np.argsort(-velocity, kind="stable")[:min(top_n, dated.sum())]
+            stats["fastest_videos"] = [dict(video, views_per_day=int(velocity[i]))
+                                       for i, video in zip(fastest, describe(fastest))]
+
+    known_ages = np.sort(ages[~np.isnan(ages)])
+    if len(known_ages) > 1:
+        gaps = np.diff(known_ages)
+        span_days = known_ages[-1] - known_ages[0]
+        stats["cadence"] = {
+            "uploads_per_week": round(float((len(known_ages) - 1) / max(span_days, 1.0) * 7), 2),
+            "median_gap_days": round(float(np.median(gaps)), 1),
+            "max_gap_days": round(float(gaps.max()), 1),
+            "days_since_last_upload": round(float(known_ages[0]), 1),
+        }
+
+    # Only uploads dated to the day tell us which weekday they went out on
+    day_ages = ages[exact & ~np.isnan(ages)]
+    if len(day_ages):
+        now_ts = np.datetime64(now.replace(microsecond=0))
+        upload_days = (now_ts - (day_ages * 86400).astype("timedelta64[s]")).astype("datetime64[D]")
+        # 1970-01-01 was a Thursday, so shift by 3 to make Monday index 0
+        weekday = (upload_days.astype(np.int64) + 3) % 7
+        counts = np.bincount(weekday, minlength=7)
+        stats["weekday_histogram"] = {
+            "sample_size": int(len(day_ages)),
+            "counts": {WEEKDAYS[i]: int(counts[i]) for i in range(7)},
+        }
+    return stats
+
+
+def format_stats_summary(channel_data, stats):
+    """Render channel overview and stats as compact text for the prompt."""
+    lines = [
+        f"Channel: {channel_data.get('channel_name')}",
+        f"Subscribers: {channel_data.get('subscriber_count')}",
+        f"Total videos: {channel_data.get('total_videos')}",
+        f"Videos analysed: {stats['video_count']}",
+    ]
+    if "views" in stats:
+        v = stats["views"]
+        lines.append(f"Views per video: mean {v['mean']}, median {v['median']}, "
+                     f"p10 {v['p10']}, p25 {v['p25']}, p75 {v['p75']}, p90 {v['p90']}")
+        for label, key in (("Top videos", "top_videos"), ("Bottom videos", "bottom_videos")):
+            lines.append(f"{label} (views | percentile | age days | title):")
+            lines.extend(f"- {video['views']} | p{video['percentile']} | {video['age_days']} | {video['title']}"
+                         for video in stats[key])
+        if "fastest_videos" in stats:
+            lines.append("Fastest growing (views/day | title):")
+            lines.extend(f"- {video['views_per_day']} | {video['title']}" for video in stats["fastest_videos"])
+    if "cadence" in stats:
+        c = stats["cadence"]
+        lines.append(f"Cadence: {c['uploads_per_week']} uploads/week, median gap {c['median_gap_days']} days, "
+                     f"longest gap {c['max_gap_days']} days, last upload {c['days_since_last_upload']} days ago")
+    if "weekday_histogram" in stats:
+        h = stats["weekday_histogram"]
+        counts = ", ".join(f"{day} {count}" for day, count in h["counts"].items())
+        lines.append(f"Uploads by weekday (from {h['sample_size']} day-precise dates): {counts}")
+    return "\n".join(lines)
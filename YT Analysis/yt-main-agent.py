@@ -1,65 +1,139 @@
 # pip -m venv venv (para crear un entorno virtual)
 # source venv/bin/activate (para activar el entorno virtual)
-# pip install openai python-dotenv agentql playwright && agentql init(para instalar las dependencias)
+# pip install openai python-dotenv agentql playwright numpy && agentql init(para instalar las dependencias)
+# YT_BROWSER_POOL_SIZE / YT_BROWSER_HEADLESS en .env configuran el pool de navegadores (ver browser_pool.py)
 # python yt-main-agent.py (para ejecutar el script)
+# python yt-main-agent.py --batch canales.txt (para analizar muchos canales en paralelo)
+# python yt-main-agent.py --compare canales.txt (un informe comparativo; líneas "url,nicho")
+# python channel_store.py <url_del_canal> (para ver el crecimiento entre snapshots)
 
+import argparse
+import asyncio
 import os
-from openai import OpenAI
+from datetime import datetime
+from openai import AsyncOpenAI, OpenAI
 from dotenv import load_dotenv
-import agentql
-from playwright.sync_api import sync_playwright
+from browser_pool import BrowserPool
+from resource_blocker import ResourceBlocker
+from batch_runner import (
+    DEFAULT_BROWSER_CONCURRENCY,
+    DEFAULT_LLM_CONCURRENCY,
+    load_channel_urls,
+    run_batch,
+)
+from snapshot_cache import DEFAULT_TTL_SECONDS, SnapshotCache
+from channel_store import DEFAULT_DB_PATH, ChannelStore
+from comparative import build_channel_table, format_comparison, load_channel_niches, niche_benchmarks
+from selector_cache import DEFAULT_SELECTOR_CACHE_PATH, SelectorCache, query_data_fast
+from video_stats import compute_video_stats, format_stats_summary
+from prompt_format import DEFAULT_TOKEN_BUDGET, estimate_tokens, format_video_table
+from stream_metrics import StreamTimer, append_metrics
+from video_harvester import (
+    CHANNEL_HEADER_QUERY,
+    channel_videos,
+    harvest_videos,
+    history_path,
+    videos_tab_url,
+)
 
 # Initialize API client
 load_dotenv()
 
 XAI_API_KEY = os.getenv("XAI_API_KEY")
+# Overridable so benchmarks can point the clients at a local OpenAI-compatible server
+XAI_BASE_URL = os.getenv("XAI_BASE_URL", "https://api.x.ai/v1")
 client = OpenAI(
     api_key=XAI_API_KEY,
-    base_url="https://api.x.ai/v1",
+    base_url=XAI_BASE_URL,
+)
+async_client = AsyncOpenAI(
+    api_key=XAI_API_KEY,
+    base_url=XAI_BASE_URL,
 )
 
-def get_channel_info(channel_url):
-    with sync_playwright() as playwright:
-        browser = playwright.chromium.launch(headless=False)
-        page = agentql.wrap(browser.new_page())
-        page.goto(channel_url)
-        
-        # AgentQL query to get channel stats
-        CHANNEL_QUERY = """
-        {
-            channel_name
-            subscriber_count
-            total_videos
-            recent_videos[] {
-                title
-                views
-                published_date
-            }
-        }
-        """
-        
-        data = page.query_data(CHANNEL_QUERY)
-        browser.close()
-        return data
-
-def get_youtube_analysis(channel_data):
-    completion = client.chat.completions.create(
-        model="grok-beta",
-        messages=[
-            {"role": "system", "content": """You are an AI specialist in YouTube channel analysis. 
+ANALYSES_DIR = "youtube_analyses"
+METRICS_PATH = os.path.join(ANALYSES_DIR, "stream_metrics.jsonl")
+
+# AgentQL query to get channel stats
+CHANNEL_QUERY = """
+{
+    channel_name
+    subscriber_count
+    total_videos
+    recent_videos[] {
+        title
+        views
+        published_date
+    }
+}
+"""
+
+async def query_page(page, query, selectors=None):
+    # Learned CSS selectors skip AgentQL's AI resolution when they still validate
+    if selectors:
+        return await query_data_fast(page, query, selectors)
+    return await page.query_data(query)
+
+async def get_channel_info(channel_url, pool, cache=None, store=None, selectors=None):
+    if cache:
+        channel_data = cache.get(channel_url)
+        if channel_data is not None:
+            return channel_data
+
+    # Borrow a page from the shared browser pool instead of launching Chromium per channel
+    async with pool.page() as page:
+        await page.goto(channel_url)
+        channel_data = await query_page(page, CHANNEL_QUERY, selectors)
+
+    if cache:
+        cache.put(channel_url, channel_data)
+    # Only fresh scrapes go into the history, cache hits would duplicate a snapshot
+    if store:
+        store.record_snapshot(channel_url, channel_data)
+    return channel_data
+
+async def harvest_channel(channel_url, pool, cache=None, max_videos=None, store=None, selectors=None):
+    """Full-history mode: scroll the whole /videos tab into a JSONL file instead of a dict."""
+    cache_key = f"{channel_url}#full-history"
+    if cache:
+        channel_data = cache.get(cache_key)
+        if channel_data is not None and os.path.exists(channel_data["videos_path"]):
+            return channel_data
+
+    async with pool.page() as page:
+        await page.goto(videos_tab_url(channel_url))
+        channel_data = await query_page(page, CHANNEL_HEADER_QUERY, selectors)
+        channel_data["videos_path"] = history_path(channel_data["channel_name"])
+        count = await harvest_videos(page, channel_data["videos_path"], max_videos)
+    print(f"[harvest] {channel_data['channel_name']}: {count} videos -> {channel_data['videos_path']}")
+
+    if cache:
+        cache.put(cache_key, channel_data)
+    if store:
+        store.record_snapshot(channel_url, channel_data)
+    return channel_data
+
+def build_analysis_messages(channel_data, token_budget=DEFAULT_TOKEN_BUDGET):
+    # Rankings, percentiles and cadence are computed locally; the model only interprets them
+    # Harvested channels are re-read from disk on each pass rather than held in memory
+    stats = compute_video_stats(channel_videos(channel_data))
+    summary = format_stats_summary(channel_data, stats)
+    video_table, kept, total = format_video_table(channel_videos(channel_data), token_budget)
+    messages = [
+        {"role": "system", "content": """You are an AI specialist in YouTube channel analysis. 
             Your task is to analyze channel data and create insightful reports focused on content strategy, 
             audience engagement, and publishing patterns. Pay special attention to what makes videos succeed or underperform."""},
-            {"role": "user", "content": f"""Please analyze this YouTube channel data and create a markdown report 
+        {"role": "user", "content": f"""Please analyze this YouTube channel data and create a markdown report 
             that includes:
 
             1. Channel Overview
             2. Top 3 Performing Videos
-               - List the videos with their views
+               - List the videos with their views (use the precomputed top videos)
                - Analyze titles for patterns
                - What likely made these videos successful?
             
             3. Bottom 3 Performing Videos
-               - List the videos with their views
+               - List the videos with their views (use the precomputed bottom videos)
                - Analyze potential reasons for lower performance
                - Suggestions for improvement
             
@@ -73,8 +147,8 @@ def get_youtube_analysis(channel_data):
                - Analyze audience engagement
             
             6. Publishing Patterns
-               - Best days and times to publish
-               - Frequency of publishing
+               - Best days and times to publish (use the weekday histogram)
+               - Frequency of publishing (use the cadence figures)
             
             7. Title optimization recommendations
                - Analyze top-performing titles
@@ -84,36 +158,231 @@ def get_youtube_analysis(channel_data):
                - Identify potential growth areas
                - Suggest strategies to increase viewership
             
+            The statistics below were computed exactly from the scraped data; quote them as-is
+            instead of recomputing them.
+
             Here's the data:
-            {channel_data}"""}
-        ],
+            {summary}
+
+            Videos:
+            {video_table}"""}
+    ]
+    prompt_tokens = sum(estimate_tokens(message["content"]) for message in messages)
+    print(f"[prompt] {channel_data.get('channel_name')}: ~{prompt_tokens} tokens, {kept}/{total} videos")
+    return messages
+
+async def get_youtube_analysis(channel_data, cache=None):
+    # Unchanged data since the last run: reuse that report instead of calling Grok
+    if cache:
+        analysis = cache.get_report(channel_data)
+        if analysis is not None:
+            return analysis
+
+    completion = await async_client.chat.completions.create(
+        model="grok-beta",
+        messages=build_analysis_messages(channel_data),
         temperature=0.7,
         max_tokens=1500
     )
-    
-    return completion.choices[0].message.content
 
-# Example usage
-if __name__ == "__main__":
-    # Create analyses directory if it doesn't exist
-    analyses_dir = "youtube_analyses"
-    if not os.path.exists(analyses_dir):
-        os.makedirs(analyses_dir)
-
-    channel_url = "https://www.youtube.com/@AlexHormozi/videos"
-    channel_data = get_channel_info(channel_url)
-    channel_name = channel_data["channel_name"]
-    
-    # Print truncated data
-    print("\nChannel Information (preview):")
-    print(str(channel_data)[:100] + "...")
-    
-    # Get analysis from Grok
-    analysis = get_youtube_analysis(channel_data)
-    
+    analysis = completion.choices[0].message.content
+    if cache:
+        cache.put_report(channel_data, analysis)
+    return analysis
+
+def report_path(channel_data):
+    os.makedirs(ANALYSES_DIR, exist_ok=True)
+    return os.path.join(ANALYSES_DIR, f"youtube_analysis_{channel_data['channel_name']}.md")
+
+def save_analysis(channel_data, analysis):
     # Save to markdown file in the analyses directory
-    output_path = os.path.join(analyses_dir, f"youtube_analysis_{channel_name}.md")
+    output_path = report_path(channel_data)
     with open(output_path, "w") as f:
         f.write(analysis)
-    
-    print(f"\nAnalysis has been saved to {output_path}")
+    return output_path
+
+def _finish_stream(channel_data, output_path, timer, usage_tokens, cache, metrics_path):
+    record = timer.finish(usage_tokens)
+    append_metrics(metrics_path, record)
+    print(f"[stream] {record['channel_name']}: ttft {record['time_to_first_token_s']}s, "
+          f"total {record['total_time_s']}s, {record['tokens_per_s']} tokens/s")
+    if cache:
+        with open(output_path) as f:
+            cache.put_report(channel_data, f.read())
+    return output_path
+
+async def stream_youtube_analysis(channel_data, cache=None, metrics_path=METRICS_PATH):
+    """Stream the report straight into its markdown file; returns the file path."""
+    if cache:
+        analysis = cache.get_report(channel_data)
+        if analysis is not None:
+            return save_analysis(channel_data, analysis)
+
+    output_path = report_path(channel_data)
+    timer = StreamTimer(channel_data.get("channel_name"))
+    usage_tokens = None
+    stream = await async_client.chat.completions.create(
+        model="grok-beta",
+        messages=build_analysis_messages(channel_data),
+        temperature=0.7,
+        max_tokens=1500,
+        stream=True,
+        stream_options={"include_usage": True},
+    )
+    with open(output_path, "w") as f:
+        async for chunk in stream:
+            if chunk.usage:
+                usage_tokens = chunk.usage.completion_tokens
+            if chunk.choices and chunk.choices[0].delta.content:
+                text = chunk.choices[0].delta.content
+                timer.chunk(estimate_tokens(text))
+                f.write(text)
+                f.flush()
+    return _finish_stream(channel_data, output_path, timer, usage_tokens, cache, metrics_path)
+
+async def analyze_channels(channel_urls, browser_concurrency, llm_concurrency, cache=None,
+                           stream=False, metrics_path=METRICS_PATH, full_history=False, max_videos=None,
+                           blocker=None, store=None, selectors=None):
+    if stream:
+        # Reports are written while they stream, so there is nothing left to save
+        analyze = lambda channel_data: stream_youtube_analysis(channel_data, cache, metrics_path)
+        save = lambda channel_data, output_path: output_path
+    else:
+        analyze = lambda channel_data: get_youtube_analysis(channel_data, cache)
+        save = save_analysis
+
+    async with BrowserPool(size=browser_concurrency, blocker=blocker) as pool:
+        return await run_batch(
+            channel_urls,
+            scrape=(lambda url: harvest_channel(url, pool, cache, max_videos, store, selectors)) if full_history
+                   else (lambda url: get_channel_info(url, pool, cache, store, selectors)),
+            analyze=analyze,
+            save=save,
+            browser_concurrency=browser_concurrency,
+            llm_concurrency=llm_concurrency,
+        )
+
+async def scrape_channels(channel_urls, browser_concurrency, cache=None, full_history=False, max_videos=None,
+                          blocker=None, store=None, selectors=None):
+    """Scrape many channels concurrently; failed channels come back as None."""
+    async with BrowserPool(size=browser_concurrency, blocker=blocker) as pool:
+        async def scrape(url):
+            try:
+                if full_history:
+                    return await harvest_channel(url, pool, cache, max_videos, store, selectors)
+                return await get_channel_info(url, pool, cache, store, selectors)
+            except Exception as e:
+                print(f"[error] {url}: {e}")
+                return None
+
+        return await asyncio.gather(*(scrape(url) for url in channel_urls))
+
+def build_comparison_messages(comparison):
+    return [
+        {"role": "system", "content": """You are an AI specialist in YouTube channel analysis.
+            Your task is to benchmark channels against each other and against their niche, for an agency
+            that manages many channels. Be concrete and refer to channels by name."""},
+        {"role": "user", "content": f"""Please compare these YouTube channels and create a markdown report
+            that includes:
+
+            1. Niche Overview
+               - How the niches compare on views per video, upload frequency and views per subscriber
+            2. Leaders and Laggards per Niche
+               - Which channels over- and under-perform their niche benchmark, and by how much
+            3. Upload Frequency vs Performance
+               - Whether channels that publish more often get more or fewer views per video
+            4. Engagement
+               - Channels whose audience engages far above or below their size (views per subscriber)
+            5. Recommendations per Channel
+               - One or two specific actions for each channel, based on the benchmarks
+
+            All figures below were computed exactly; "pct" is the channel's percentile within its niche.
+            Quote them as-is instead of recomputing them.
+
+            {comparison}"""}
+    ]
+
+def get_comparative_analysis(channels):
+    """One LLM call for all channels: `channels` is a list of (channel_data, niche)."""
+    table = build_channel_table(channels)
+    comparison = format_comparison(table, niche_benchmarks(table))
+    messages = build_comparison_messages(comparison)
+    prompt_tokens = sum(estimate_tokens(message["content"]) for message in messages)
+    print(f"[prompt] comparative analysis of {len(channels)} channels: ~{prompt_tokens} tokens")
+
+    completion = client.chat.completions.create(
+        model="grok-beta",
+        messages=messages,
+        temperature=0.7,
+        max_tokens=3000
+    )
+    return completion.choices[0].message.content
+
+def save_comparative_analysis(analysis):
+    os.makedirs(ANALYSES_DIR, exist_ok=True)
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    output_path = os.path.join(ANALYSES_DIR, f"comparative_analysis_{timestamp}.md")
+    with open(output_path, "w") as f:
+        f.write(analysis)
+    return output_path
+
+# Example usage
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Analyze YouTube channels with AgentQL + Grok")
+    parser.add_argument("channel_url", nargs="?", default="https://www.youtube.com/@AlexHormozi/videos")
+    parser.add_argument("--batch", metavar="FILE", help="file with one channel URL per line")
+    parser.add_argument("--compare", metavar="FILE",
+                        help="file with 'channel_url[,niche]' lines; writes one comparative report")
+    parser.add_argument("--browser-concurrency", type=int, default=DEFAULT_BROWSER_CONCURRENCY)
+    parser.add_argument("--llm-concurrency", type=int, default=DEFAULT_LLM_CONCURRENCY)
+    parser.add_argument("--cache-ttl-hours", type=float, default=DEFAULT_TTL_SECONDS / 3600)
+    parser.add_argument("--no-cache", action="store_true", help="always re-scrape and re-analyze")
+    parser.add_argument("--stream", action="store_true", help="stream reports to disk and record latency metrics")
+    parser.add_argument("--metrics-file", default=METRICS_PATH)
+    parser.add_argument("--full-history", action="store_true",
+                        help="scroll the whole /videos tab into video_history/<channel>.jsonl")
+    parser.add_argument("--max-videos", type=int, default=None, help="stop harvesting after N videos")
+    parser.add_argument("--no-block-resources", action="store_true",
+                        help="let the browser download images, media, fonts and ads")
+    parser.add_argument("--history-db", default=DEFAULT_DB_PATH,
+                        help="SQLite file where every scraped snapshot is appended")
+    parser.add_argument("--no-history", action="store_true", help="don't record snapshots")
+    parser.add_argument("--fast-selectors", action="store_true",
+                        help="reuse CSS selectors learned from AgentQL, falling back to AgentQL when they fail")
+    parser.add_argument("--selector-cache", default=DEFAULT_SELECTOR_CACHE_PATH)
+    args = parser.parse_args()
+
+    cache = None if args.no_cache else SnapshotCache(ttl_seconds=args.cache_ttl_hours * 3600)
+    blocker = None if args.no_block_resources else ResourceBlocker.from_env()
+    store = None if args.no_history else ChannelStore(args.history_db)
+    selectors = SelectorCache(args.selector_cache) if args.fast_selectors else None
+
+    if args.compare:
+        niche_by_url = load_channel_niches(args.compare)
+        scraped = asyncio.run(scrape_channels([url for url, _ in niche_by_url], args.browser_concurrency, cache,
+                                              full_history=args.full_history, max_videos=args.max_videos,
+                                              blocker=blocker, store=store, selectors=selectors))
+        channels = [(channel_data, niche) for channel_data, (_, niche) in zip(scraped, niche_by_url)
+                    if channel_data is not None]
+        if not channels:
+            # Nothing to compare: don't pay for a Grok call on an empty table
+            print("\nNo channel could be scraped, skipping the comparative analysis")
+        else:
+            output_path = save_comparative_analysis(get_comparative_analysis(channels))
+            print(f"\nComparative analysis of {len(channels)} channels has been saved to {output_path}")
+    else:
+        # A single channel is a batch of one, so it runs through the same async path
+        channel_urls = load_channel_urls(args.batch) if args.batch else [args.channel_url]
+        browser_concurrency = args.browser_concurrency if args.batch else 1
+        llm_concurrency = args.llm_concurrency if args.batch else 1
+        asyncio.run(analyze_channels(channel_urls, browser_concurrency, llm_concurrency, cache,
+                                     stream=args.stream, metrics_path=args.metrics_file,
+                                     full_history=args.full_history, max_videos=args.max_videos,
+                                     blocker=blocker, store=store, selectors=selectors))
+
+    if blocker:
+        blocker.print_report()
+    if store:
+        store.close()
+    if selectors:
+        print(f"[selectors] {selectors.hits} pages via cached selectors, {selectors.misses} via AgentQL")
@@ -1,4 +1,7 @@
+from functools import partial
+
 from crewai import Agent, LLM
+from tools.concurrency import run_concurrently
 from tools.scraping_tools import (
     tavily_search
 )
@@ -54,12 +57,6 @@ class AnalystAgent:
         context = research_data.get("context", "")
         topic = research_data.get("topic", "")
         
-        # Verify and update information
-        latest_updates = tavily_search.func(
-            query=f"latest news and developments about {topic}",
-            max_results=5
-        )
-        
         # Get specific insights through targeted questions
         analysis_questions = [
             f"What are the key trends in {topic}?",
@@ -67,11 +64,15 @@ class AnalystAgent:
             f"What are expert opinions on {topic}?"
         ]
         
-        insights = {}
-        for question in analysis_questions:
-            insights[question] = tavily_search.func(
-                query=question
-            )
+        # Latest updates and every question are independent searches, run at once
+        results = run_concurrently(
+            [partial(tavily_search.func, query=f"latest news and developments about {topic}", max_results=5)]
+            + [partial(tavily_search.func, query=question) for question in analysis_questions]
+        )
+        
+        # Verify and update information
+        latest_updates = results[0]
+        insights = dict(zip(analysis_questions, results[1:]))
         
         return {
             "topic": topic,
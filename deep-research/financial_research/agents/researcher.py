@@ -1,11 +1,15 @@
+from functools import partial
+
 from crewai import Agent
+from tools.concurrency import run_concurrently
 from tools.scraping_tools import (
     tavily_search,
     firecrawl_scrape,
-    firecrawl_crawl
+    firecrawl_crawl,
+    firecrawl
 )
 from langchain_openai import ChatOpenAI
-from typing import Dict, Any
+from typing import Dict, Any, Callable, Optional
 
 class ResearchAgent:
     """Agent responsible for gathering and organizing research data"""
@@ -56,12 +60,6 @@ class ResearchAgent:
         Returns:
             Dict containing research results and sources
         """
-        # First get broad context using Tavily
-        context = tavily_search.func(
-            query=topic,
-            max_results=10
-        )
-        
         # Get specific answers to key questions
         key_questions = [
             f"What are the main aspects of {topic}?",
@@ -69,24 +67,25 @@ class ResearchAgent:
             f"What are the key challenges in {topic}?",
         ]
         
-        answers = {}
-        for question in key_questions:
-            answers[question] = tavily_search.func(
-                query=question
-            )
+        # Broad context, key questions and (for advanced research) the top URLs are
+        # independent searches, so they all run at once
+        searches = [partial(tavily_search.func, query=topic, max_results=10)]
+        searches += [partial(tavily_search.func, query=question) for question in key_questions]
+        if depth == "advanced":
+            searches.append(partial(tavily_search.func, query=topic))
+        results = run_concurrently(searches)
+        
+        context = results[0]
+        answers = dict(zip(key_questions, results[1:1 + len(key_questions)]))
         
         # For deeper research, crawl top relevant websites
         if depth == "advanced":
             # Get top relevant URLs from search
-            search_results = tavily_search.func(query=topic)
+            search_results = results[-1]
+            urls = [result.get("url") for result in search_results.get("results", []) if result.get("url")]
             
-            detailed_content = []
-            for result in search_results.get("results", []):
-                url = result.get("url")
-                if url:
-                    # Scrape detailed content
-                    content = firecrawl_scrape.func(url)
-                    detailed_content.append(content)
+            # Scrape detailed content, keeping the search ranking order
+            detailed_content = run_concurrently([partial(firecrawl_scrape.func, url) for url in urls])
         
         return {
             "context": context,
@@ -130,8 +129,14 @@ class ResearchAgent:
         """
         return firecrawl_scrape.func(url)
     
-    def crawl_site(self, url: str, max_depth: int = 2) -> Dict[str, Any]:
+    def crawl_site(self, url: str, max_depth: int = 2,
+                   on_page: Optional[Callable[[Dict[str, Any]], None]] = None) -> Dict[str, Any]:
         """
         Crawl an entire website
+        
+        on_page receives each page as soon as it is crawled, so analysis can start
+        before the whole site is done
         """
+        if on_page:
+            return firecrawl.crawl_website(url, max_depth=max_depth, on_page=on_page)
         return firecrawl_crawl.func(url=url, max_depth=max_depth) 
\ No newline at end of file
@@ -19,4 +19,19 @@ class Config:
     
     # Tool configurations
     MAX_SEARCH_RESULTS = int(os.getenv('MAX_SEARCH_RESULTS', '10'))
-    SEARCH_TIMEOUT = 30  # seconds 
\ No newline at end of file
+    SEARCH_TIMEOUT = float(os.getenv('SEARCH_TIMEOUT', '30'))  # read timeout in seconds
+    SCRAPE_TIMEOUT = float(os.getenv('SCRAPE_TIMEOUT', '90'))  # Firecrawl renders pages before answering
+    CONNECT_TIMEOUT = float(os.getenv('CONNECT_TIMEOUT', '5'))  # seconds
+    
+    # HTTP connection pooling
+    HTTP_POOL_CONNECTIONS = int(os.getenv('HTTP_POOL_CONNECTIONS', '10'))  # hosts kept in the pool
+    HTTP_POOL_MAXSIZE = int(os.getenv('HTTP_POOL_MAXSIZE', '10'))  # open connections per host
+    HTTP_CONNECT_RETRIES = int(os.getenv('HTTP_CONNECT_RETRIES', '2'))
+    
+    # Searches/scrapes an agent runs at the same time
+    MAX_CONCURRENT_REQUESTS = int(os.getenv('MAX_CONCURRENT_REQUESTS', '5'))
+    
+    # Firecrawl crawl jobs are polled until they complete
+    CRAWL_POLL_INTERVAL = float(os.getenv('CRAWL_POLL_INTERVAL', '2'))  # seconds, first poll
+    CRAWL_MAX_POLL_INTERVAL = float(os.getenv('CRAWL_MAX_POLL_INTERVAL', '30'))  # seconds, backoff cap
+    CRAWL_TIMEOUT = float(os.getenv('CRAWL_TIMEOUT', '600'))  # seconds before giving up on a job 
\ No newline at end of file
@@ -0,0 +1,22 @@
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, List
+
+from config.config import Config
+
+
+def run_concurrently(calls: List[Callable[[], Any]], max_workers: int = None) -> List[Any]:
+    """
+    Run independent API calls on a bounded thread pool
+    
+    Args:
+        calls: Zero-argument callables, e.g. functools.partial(tavily_search.func, query=...)
+        max_workers: Maximum calls in flight (defaults to Config.MAX_CONCURRENT_REQUESTS)
+        
+    Returns:
+        List of results in the same order as `calls`
+    """
+    if not calls:
+        return []
+    max_workers = min(max_workers or Config.MAX_CONCURRENT_REQUESTS, len(calls))
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(lambda call: call(), calls))
@@ -0,0 +1,43 @@
+import threading
+from typing import Tuple
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from config.config import Config
+
+_session = None
+_lock = threading.Lock()
+
+
+def get_session() -> requests.Session:
+    """
+    Shared HTTP session used by all tools
+    
+    Connections are kept alive and pooled per host, so repeated calls to the same API
+    skip the TCP and TLS handshakes. Only failed connection attempts are retried, since
+    a POST that reached the server may already have been processed.
+    
+    Returns:
+        requests.Session shared by the whole process
+    """
+    global _session
+    with _lock:
+        if _session is None:
+            adapter = HTTPAdapter(
+                pool_connections=Config.HTTP_POOL_CONNECTIONS,
+                pool_maxsize=Config.HTTP_POOL_MAXSIZE,
+                max_retries=Retry(total=Config.HTTP_CONNECT_RETRIES, connect=Config.HTTP_CONNECT_RETRIES,
+                                  read=0, status=0, other=0, backoff_factor=0.5),
+            )
+            session = requests.Session()
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            _session = session
+    return _session
+
+
+def timeout(read_timeout: float = None) -> Tuple[float, float]:
+    """(connect, read) timeout for requests; the read timeout defaults to Config.SEARCH_TIMEOUT"""
+    return (Config.CONNECT_TIMEOUT, read_timeout or Config.SEARCH_TIMEOUT)
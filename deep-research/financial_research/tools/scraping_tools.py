@@ -1,7 +1,11 @@
 from langchain.tools import Tool
-from typing import Dict, Any, Optional
-import requests
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, Callable, Iterator, List, Optional, Tuple
+import queue
+import threading
+import time
 from config.config import Config
+from tools.http_session import get_session, timeout
 
 # class SerperTool:
 #     """Tool for performing web searches using Serper API"""
@@ -45,6 +49,7 @@ class TavilySearchTool:
             "Authorization": f"Bearer {self.api_key}",
             "Content-Type": "application/json"
         }
+        self.session = get_session()
 
     def search(self, query: str, max_results: int = 5) -> Dict[str, Any]:
         """
@@ -64,10 +69,11 @@ class TavilySearchTool:
                 "include_answer": True
             }
 
-            response = requests.post(
+            response = self.session.post(
                 self.base_url,
                 headers=self.headers,
-                json=payload
+                json=payload,
+                timeout=timeout()
             )
             
             if response.status_code != 200:
@@ -94,6 +100,7 @@ class FirecrawlTool:
             "Authorization": f"Bearer {self.api_key}",
             "Content-Type": "application/json"
         }
+        self.session = get_session()
 
     def scrape_url(self, url: str) -> Dict[str, Any]:
         """
@@ -106,10 +113,11 @@ class FirecrawlTool:
             Dict containing scraped content and metadata
         """
         try:
-            response = requests.post(
+            response = self.session.post(
                 f"{self.base_url}/scrape",
                 headers=self.headers,
-                json={"url": url}
+                json={"url": url},
+                timeout=timeout(Config.SCRAPE_TIMEOUT)
             )
             
             if response.status_code != 200:
@@ -126,26 +134,27 @@ class FirecrawlTool:
                 "details": str(e)
             }
 
-    def crawl_website(self, url: str, max_depth: Optional[int] = None) -> Dict[str, Any]:
+    def start_crawl(self, url: str, max_depth: Optional[int] = None) -> Dict[str, Any]:
         """
-        Crawl a website starting from a URL
+        Submit a crawl job; Firecrawl crawls asynchronously and answers with a job id
         
         Args:
             url: Starting URL to crawl
             max_depth: Maximum crawl depth (optional)
             
         Returns:
-            Dict containing crawl results
+            Dict with the job "id", or an error dict
         """
         payload = {"url": url}
         if max_depth:
             payload["maxDepth"] = max_depth
 
         try:
-            response = requests.post(
+            response = self.session.post(
                 f"{self.base_url}/crawl",
                 headers=self.headers,
-                json=payload
+                json=payload,
+                timeout=timeout()
             )
             
             if response.status_code != 200:
@@ -162,6 +171,156 @@ class FirecrawlTool:
                 "details": str(e)
             }
 
+    def _crawl_status(self, status_url: str) -> Optional[Dict[str, Any]]:
+        """Fetch one page of a crawl job's status; None when the poll should just be retried"""
+        try:
+            response = self.session.get(status_url, headers=self.headers, timeout=timeout())
+        except OSError:
+            # requests' connection errors and timeouts: the job keeps running on Firecrawl
+            return None
+        if response.status_code == 429 or response.status_code >= 500:
+            return None
+        response.raise_for_status()
+        return response.json()
+
+    def iter_crawl(self, job_id: str, stop: Optional[threading.Event] = None) -> Iterator[Dict[str, Any]]:
+        """
+        Yield the pages of a crawl job as soon as Firecrawl has scraped them
+        
+        The job is polled with exponential backoff (reset whenever new pages arrive) and
+        only pages not received yet are requested, using the `skip` offset. Firecrawl
+        also returns `next` while the job runs, so it only means "more data now" when the
+        response carried new pages; otherwise the loop sleeps like any other poll. Polls
+        answered with 429, 5xx or a connection error are retried with the same backoff.
+        
+        Args:
+            job_id: Id returned by start_crawl
+            stop: Event that ends the iteration early when set (optional)
+            
+        Returns:
+            Iterator of page dicts (markdown, metadata, ...)
+            
+        Raises:
+            RuntimeError: if the job fails or takes longer than Config.CRAWL_TIMEOUT
+            requests.HTTPError: if a poll is rejected with any other 4xx
+        """
+        deadline = time.monotonic() + Config.CRAWL_TIMEOUT
+        interval = Config.CRAWL_POLL_INTERVAL
+        received = 0
+        seen_urls = set()
+        while True:
+            status = self._crawl_status(f"{self.base_url}/crawl/{job_id}?skip={received}") or {}
+            data = status.get("data") or []
+            new_pages = 0
+            for page in data:
+                received += 1
+                source_url = (page.get("metadata") or {}).get("sourceURL")
+                if source_url and source_url in seen_urls:
+                    continue
+                seen_urls.add(source_url)
+                new_pages += 1
+                yield page
+
+            # A paginated response with new pages has more ready: fetch them without waiting
+            if status.get("next") and new_pages:
+                continue
+            if status.get("status") == "completed":
+                return
+            if status.get("status") in ("failed", "cancelled"):
+                raise RuntimeError(f"Crawl {job_id} {status.get('status')}: {status.get('error', '')}")
+            if time.monotonic() > deadline:
+                raise RuntimeError(f"Crawl {job_id} still running after {Config.CRAWL_TIMEOUT}s")
+
+            interval = Config.CRAWL_POLL_INTERVAL if new_pages else min(interval * 2, Config.CRAWL_MAX_POLL_INTERVAL)
+            if stop is None:
+                time.sleep(interval)
+            elif stop.wait(interval):
+                return
+
+    def crawl_many(self, urls: List[str], max_depth: Optional[int] = None) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        """
+        Crawl several websites at once, yielding pages from whichever job has new ones
+        
+        Args:
+            urls: Starting URLs, one crawl job each
+            max_depth: Maximum crawl depth (optional)
+            
+        Returns:
+            Iterator of (start url, page) tuples; a failed job yields (start url, error dict)
+        """
+        pages = queue.Queue()
+        done = object()
+        # Set when the consumer stops early, so workers stop polling instead of blocking it
+        stop = threading.Event()
+
+        def crawl(url):
+            try:
+                job = self.start_crawl(url, max_depth)
+                if "error" in job:
+                    pages.put((url, job))
+                    return
+                for page in self.iter_crawl(job["id"], stop):
+                    if stop.is_set():
+                        return
+                    pages.put((url, page))
+            except Exception as e:
+                pages.put((url, {"error": "Crawl failed", "details": str(e)}))
+            finally:
+                pages.put((url, done))
+
+        executor = ThreadPoolExecutor(max_workers=max(1, min(len(urls), Config.MAX_CONCURRENT_REQUESTS)))
+        try:
+            for url in urls:
+                executor.submit(crawl, url)
+            remaining = len(urls)
+            while remaining:
+                url, page = pages.get()
+                if page is done:
+                    remaining -= 1
+                else:
+                    yield url, page
+        finally:
+            stop.set()
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def crawl_website(self, url: str, max_depth: Optional[int] = None,
+                      on_page: Optional[Callable[[Dict[str, Any]], None]] = None) -> Dict[str, Any]:
+        """
+        Crawl a website starting from a URL and wait for the job to complete
+        
+        Args:
+            url: Starting URL to crawl
+            max_depth: Maximum crawl depth (optional)
+            on_page: Called with each page as soon as it is crawled (optional)
+            
+        Returns:
+            Dict containing crawl results
+        """
+        job = self.start_crawl(url, max_depth)
+        if "error" in job:
+            return job
+
+        data = []
+        try:
+            for page in self.iter_crawl(job["id"]):
+                data.append(page)
+                if on_page:
+                    on_page(page)
+        except Exception as e:
+            return {
+                "error": "Crawl failed",
+                "details": str(e),
+                "id": job["id"],
+                "data": data
+            }
+
+        return {
+            "status": "completed",
+            "id": job["id"],
+            "total": len(data),
+            "data": data
+        }
+
 # Initialize tool instances
 tavily = TavilySearchTool()
 firecrawl = FirecrawlTool()